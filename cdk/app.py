@@ -76,7 +76,7 @@ api_stack = ApiStack(
     executions_table=database_stack.executions_table,
     execution_queue=execution_stack.execution_queue,
     cron_handler_arn=triggers_stack.cron_handler.function_arn,
-    poller_arn=triggers_stack.poller.function_arn,
+    poller_arn=triggers_stack.poller_alias.function_arn,
     environment=environment,
     env=env,
 )
@@ -25,6 +25,7 @@ class TriggersStack(Stack):
     Attributes:
         cron_handler: Lambda function invoked by EventBridge cron rules
         poller: Lambda function invoked by EventBridge poll rules
+        poller_alias: Alias on the poller's latest published (SnapStart) version
     """
 
     def __init__(
@@ -72,8 +73,8 @@ class TriggersStack(Stack):
         CfnOutput(
             self,
             "PollerArn",
-            value=self.poller.function_arn,
-            description="Poller Lambda ARN for EventBridge targets",
+            value=self.poller_alias.function_arn,
+            description="Poller Lambda alias ARN for EventBridge targets",
             export_name=f"{environment}-automation-poller-arn",
         )
 
@@ -176,12 +177,12 @@ class TriggersStack(Stack):
             "Poller",
             function_name=function_name,
             description="Polls URLs for changes and triggers workflows",
-            runtime=lambda_.Runtime.PYTHON_3_11,
+            runtime=lambda_.Runtime.PYTHON_3_12,  # SnapStart needs 3.12+
             handler="handler.handler",
             code=lambda_.Code.from_asset(
                 path=os.path.join(lambdas_dir, "poller"),
                 bundling={
-                    "image": lambda_.Runtime.PYTHON_3_11.bundling_image,
+                    "image": lambda_.Runtime.PYTHON_3_12.bundling_image,
                     "command": [
                         "bash",
                         "-c",
@@ -194,6 +195,18 @@ class TriggersStack(Stack):
             environment=env_vars,
             log_group=log_group,
             tracing=lambda_.Tracing.ACTIVE,
+            # Restore from a pre-initialized snapshot instead of re-importing
+            # boto3/lxml/Powertools on every cold start
+            snap_start=lambda_.SnapStartConf.ON_PUBLISHED_VERSIONS,
+        )
+
+        # SnapStart only applies to published versions, so EventBridge must
+        # target an alias. current_version publishes a new one on each change.
+        self.poller_alias = lambda_.Alias(
+            self,
+            "PollerLiveAlias",
+            alias_name="live",
+            version=self.poller.current_version,
         )
 
         # Grant DynamoDB permissions
@@ -203,13 +216,20 @@ class TriggersStack(Stack):
         # Grant SQS send permissions
         self.execution_queue.grant_send_messages(self.poller)
 
-        # Grant EventBridge permission to invoke this Lambda
+        # Grant EventBridge permission to invoke this Lambda. The unqualified
+        # grant stays for rules created before targets moved to the alias.
         self.poller.add_permission(
             "EventBridgeInvoke",
             principal=iam.ServicePrincipal("events.amazonaws.com"),
             action="lambda:InvokeFunction",
             source_account=self.account,
         )
+        self.poller_alias.add_permission(
+            "EventBridgeInvokeAlias",
+            principal=iam.ServicePrincipal("events.amazonaws.com"),
+            action="lambda:InvokeFunction",
+            source_account=self.account,
+        )
 
         # Grant permission to disable EventBridge rules (for auto-disable on failure)
         self.poller.add_to_role_policy(
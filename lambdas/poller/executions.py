@@ -0,0 +1,169 @@
+"""Execution queueing for the poller.
+
+Executions found during an invocation are buffered and sent to SQS in
+batches once every workflow has been polled. A workflow's poll state is
+only saved after its message is queued.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import time
+from typing import Iterator
+
+import boto3
+import orjson
+from aws_lambda_powertools import Logger
+
+from failures import handle_failure
+from repository import update_poll_state
+
+logger = Logger(child=True)
+
+EXECUTION_QUEUE_URL = os.environ.get("EXECUTION_QUEUE_URL", "")
+SQS_BATCH_SIZE = 10  # SendMessageBatch entry limit
+SQS_BATCH_MAX_BYTES = 256 * 1024  # SendMessageBatch combined payload limit
+
+
+@functools.cache
+def _sqs():
+    """Get the SQS client, built on first use."""
+    return boto3.client("sqs")
+
+
+def generate_execution_id() -> str:
+    """Generate a ULID-style execution ID.
+
+    Returns:
+        Execution ID with 'ex_' prefix
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    return "ex_" + timestamp_ms.to_bytes(6, "big").hex() + os.urandom(5).hex()
+
+
+def queue_execution(
+    workflow_id: str,
+    trigger_data: dict,
+    poll_state: dict,
+    state_updates: dict,
+    pending: list[dict],
+) -> str:
+    """Buffer an execution request for the next SQS batch send.
+
+    The poll's state updates are held with it and only saved once the
+    message is queued, so a failed send is detected again on the next poll.
+
+    Args:
+        workflow_id: Workflow identifier
+        trigger_data: Poll trigger data
+        poll_state: Poll state the change was detected against
+        state_updates: Poll state updates to save once queued
+        pending: Per-invocation list of buffered executions
+
+    Returns:
+        Generated execution ID
+    """
+    execution_id = generate_execution_id()
+
+    message = {
+        "workflow_id": workflow_id,
+        "execution_id": execution_id,
+        "trigger_type": "poll",
+        "trigger_data": trigger_data,
+    }
+    body = orjson.dumps(message)
+    pending.append({
+        "entry": {"Id": execution_id, "MessageBody": body.decode()},
+        "size": len(body),
+        "workflow_id": workflow_id,
+        "poll_state": poll_state,
+        "state_updates": state_updates,
+    })
+
+    return execution_id
+
+
+def _iter_batches(pending: list[dict]) -> Iterator[list[dict]]:
+    """Group buffered executions into batches SendMessageBatch accepts.
+
+    A batch is closed at SQS_BATCH_SIZE entries or before its message
+    bodies would exceed SQS_BATCH_MAX_BYTES combined, so a few large poll
+    messages can't fail a whole batch with BatchRequestTooLong.
+
+    Args:
+        pending: Executions buffered by queue_execution
+
+    Yields:
+        Lists of buffered executions, in order
+    """
+    batch: list[dict] = []
+    batch_bytes = 0
+
+    for execution in pending:
+        size = execution["size"]
+        if batch and (
+            len(batch) == SQS_BATCH_SIZE or batch_bytes + size > SQS_BATCH_MAX_BYTES
+        ):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(execution)
+        batch_bytes += size
+
+    if batch:
+        yield batch
+
+
+def flush_executions(pending: list[dict]) -> dict[str, dict]:
+    """Send buffered executions using SQS batch sends, then save poll state.
+
+    Each queued execution's state updates are saved after the send. An
+    execution that fails to send is recorded through handle_failure
+    instead, leaving its seen items and content hash untouched.
+
+    Args:
+        pending: Executions buffered by queue_execution
+
+    Returns:
+        Mapping of workflow_id to a failed status dict for each execution
+        that could not be queued
+    """
+    failures: dict[str, dict] = {}
+
+    for batch in _iter_batches(pending):
+        try:
+            response = _sqs().send_message_batch(
+                QueueUrl=EXECUTION_QUEUE_URL,
+                Entries=[execution["entry"] for execution in batch],
+            )
+        except Exception as e:
+            logger.exception("Failed to send execution batch")
+            errors = {execution["entry"]["Id"]: str(e) for execution in batch}
+        else:
+            errors = {
+                failed["Id"]: failed.get("Message") or failed.get("Code", "Unknown error")
+                for failed in response.get("Failed", [])
+            }
+
+        queued = []
+        for execution in batch:
+            workflow_id = execution["workflow_id"]
+            execution_id = execution["entry"]["Id"]
+            logger.append_keys(workflow_id=workflow_id)
+
+            error = errors.get(execution_id)
+            if error is None:
+                update_poll_state(workflow_id, execution["state_updates"])
+                queued.append(execution_id)
+                continue
+
+            logger.error("Failed to queue execution", execution_id=execution_id, error=error)
+            handle_failure(workflow_id, execution["poll_state"], f"Queue failed: {error}")
+            failures[workflow_id] = {"status": "failed", "error": error}
+
+        if queued and logger.isEnabledFor(logging.INFO):
+            logger.info("Executions queued", execution_ids=queued)
+
+    return failures
@@ -0,0 +1,141 @@
+"""Poll failure handling for the poller.
+
+Consecutive failures are counted in poll state. After
+MAX_CONSECUTIVE_FAILURES the workflow and its EventBridge rule are
+disabled and a Discord notification is sent.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import boto3
+import orjson
+from aws_lambda_powertools import Logger
+
+from fetch import SESSION
+from repository import disable_workflow, now_iso, update_poll_state
+
+logger = Logger(child=True)
+
+DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL", "")
+ENVIRONMENT = os.environ.get("ENVIRONMENT", "dev")
+MAX_CONSECUTIVE_FAILURES = 4
+
+# Runs the auto-disable calls concurrently; threads start on first use.
+_FAILURE_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+@functools.cache
+def _events():
+    """Get the EventBridge client, built on first use."""
+    return boto3.client("events")
+
+
+def get_poll_rule_name(workflow_id: str) -> str:
+    """Get EventBridge rule name for poll trigger.
+
+    Args:
+        workflow_id: Workflow identifier
+
+    Returns:
+        Rule name
+    """
+    return f"automations-{ENVIRONMENT}-{workflow_id}-poll"
+
+
+def disable_eventbridge_rule(workflow_id: str) -> None:
+    """Disable EventBridge poll rule.
+
+    Args:
+        workflow_id: Workflow identifier
+    """
+    rule_name = get_poll_rule_name(workflow_id)
+    events_client = _events()
+    try:
+        events_client.disable_rule(Name=rule_name)
+        logger.info("EventBridge rule disabled", rule_name=rule_name)
+    except events_client.exceptions.ResourceNotFoundException:
+        logger.warning("Rule not found", rule_name=rule_name)
+
+
+def send_discord_notification(
+    workflow_id: str,
+    error: str,
+    failures: int,
+) -> None:
+    """Send Discord notification about auto-disabled workflow.
+
+    Args:
+        workflow_id: Workflow identifier
+        error: Last error message
+        failures: Number of consecutive failures
+    """
+    if not DISCORD_WEBHOOK_URL:
+        logger.warning("No DISCORD_WEBHOOK_URL configured, skipping notification")
+        return
+
+    try:
+        message = (
+            f"Workflow `{workflow_id}` auto-disabled after {failures} "
+            f"consecutive polling failures.\nLast error: {error[:500]}"
+        )
+
+        SESSION.post(
+            DISCORD_WEBHOOK_URL,
+            data=orjson.dumps({"content": message}),
+            headers={"Content-Type": "application/json"},
+            timeout=10,
+        )
+        logger.info("Discord notification sent")
+    except Exception as e:
+        logger.warning("Failed to send Discord notification", error=str(e))
+
+
+def handle_failure(
+    workflow_id: str,
+    poll_state: dict,
+    error: str,
+) -> None:
+    """Handle poll failure, auto-disable after threshold.
+
+    Args:
+        workflow_id: Workflow identifier
+        poll_state: Current poll state
+        error: Error message
+    """
+    failures = poll_state.get("consecutive_failures", 0) + 1
+
+    logger.warning(
+        "Poll failed",
+        consecutive_failures=failures,
+        error=error,
+    )
+
+    state_updates = {
+        "consecutive_failures": failures,
+        "last_error": error[:1000],
+        "last_checked_at": now_iso(),
+    }
+
+    if failures < MAX_CONSECUTIVE_FAILURES:
+        update_poll_state(workflow_id, state_updates)
+        return
+
+    logger.error(
+        "Max failures reached, auto-disabling workflow",
+        failures=failures,
+    )
+
+    # The four calls hit independent services/items, so overlap them
+    futures = [
+        _FAILURE_POOL.submit(update_poll_state, workflow_id, state_updates),
+        _FAILURE_POOL.submit(disable_workflow, workflow_id),
+        _FAILURE_POOL.submit(disable_eventbridge_rule, workflow_id),
+        _FAILURE_POOL.submit(send_discord_notification, workflow_id, error, failures),
+    ]
+    wait(futures)
+    for future in futures:
+        future.result()  # Re-raise anything the DynamoDB calls raised
@@ -0,0 +1,179 @@
+"""RSS/Atom feed parsing for the poller.
+
+Feeds are streamed with lxml's iterparse so large feeds parse in flat
+memory, and each entry is normalized into the item dict passed to
+workflows as poll trigger data.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import Iterator
+
+from lxml import etree
+
+from seen_items import item_fingerprint
+
+MAX_FEED_ITEMS = 100  # Limit items to process per poll
+
+
+def _element_text(element: etree._Element | None) -> str:
+    """Get the stripped text of an element and its children."""
+    if element is None:
+        return ""
+    return "".join(element.itertext()).strip()
+
+
+def _entry_link(entry: etree._Element) -> str:
+    """Get an item's link from an RSS <link> text or an Atom <link href>.
+
+    Atom entries prefer the alternate link, falling back to the first href.
+    """
+    fallback = ""
+    for link in entry.iterfind("{*}link"):
+        href = link.get("href")
+        if href is None:
+            text = (link.text or "").strip()
+            if text:
+                return text
+        elif link.get("rel", "alternate") == "alternate":
+            return href
+        elif not fallback:
+            fallback = href
+    return fallback
+
+
+def _entry_guid(entry: etree._Element) -> str:
+    """Get an item's GUID: prefer id, then guid, fallback to link."""
+    return (
+        _element_text(entry.find("{*}id"))
+        or _element_text(entry.find("{*}guid"))
+        or _entry_link(entry)
+    )
+
+
+def _first_child(entry: etree._Element, *tags: str) -> etree._Element | None:
+    """Get the first child matching any of the tags, in preference order."""
+    for tag in tags:
+        element = entry.find(tag)
+        if element is not None:
+            return element
+    return None
+
+
+def _entry_to_item(entry: etree._Element, guid: str) -> dict:
+    """Build the normalized item dict for an <item> or <entry> element.
+
+    Mirrors feedparser's fallbacks: the summary falls back to the full
+    content, and an RSS item without a <link> uses its permalink <guid>.
+    """
+    # RSS 1.0 uses dc:date; content:encoded is the RSS full-content element
+    published = _first_child(entry, "{*}pubDate", "{*}published", "{*}date")
+    summary = _first_child(entry, "{*}description", "{*}summary", "{*}content", "{*}encoded")
+
+    link = _entry_link(entry)
+    if not link:
+        guid_element = entry.find("{*}guid")
+        if guid_element is not None and guid_element.get("isPermaLink") != "false":
+            link = _element_text(guid_element)
+
+    return {
+        "title": _element_text(entry.find("{*}title")),
+        "link": link,
+        "guid": guid,
+        "published": _element_text(published),
+        "summary": _element_text(summary)[:500],
+    }
+
+
+def _iter_feed_entries(content: str | bytes) -> Iterator[etree._Element]:
+    """Stream the <item>/<entry> elements of a feed, at most MAX_FEED_ITEMS.
+
+    Only top-level entries are yielded; an <item> or <entry> nested inside
+    one (e.g. in extension markup) stays part of its parent. Each element
+    is cleared once the caller moves on, so memory stays flat on large
+    feeds. Parsing stops quietly at unrecoverable markup.
+
+    Args:
+        content: Raw feed content
+
+    Yields:
+        Feed entry elements in document order
+    """
+    if isinstance(content, str):
+        content = content.encode()
+
+    entries = etree.iterparse(
+        BytesIO(content),
+        events=("start", "end"),
+        tag=("{*}item", "{*}entry"),
+        recover=True,
+        resolve_entities=False,
+        no_network=True,
+    )
+
+    count = 0
+    depth = 0
+    try:
+        for event, entry in entries:
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth:
+                continue  # Nested entry: cleared along with its parent
+
+            yield entry
+
+            entry.clear()
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+
+            count += 1
+            if count >= MAX_FEED_ITEMS:
+                return
+    except etree.XMLSyntaxError:
+        # Unrecoverable markup (e.g. empty body): keep whatever was parsed
+        return
+
+
+def parse_feed(content: str | bytes) -> list[dict]:
+    """Parse RSS/Atom feed and return normalized items.
+
+    Args:
+        content: Raw feed content
+
+    Returns:
+        List of normalized item dicts with title, link, guid, published, summary
+    """
+    return [_entry_to_item(entry, _entry_guid(entry)) for entry in _iter_feed_entries(content)]
+
+
+def parse_new_feed_items(
+    content: str | bytes,
+    seen_fingerprints: set[bytes],
+) -> tuple[list[dict], list[bytes]]:
+    """Parse only the feed items that haven't been seen yet.
+
+    Each entry's GUID is read and fingerprinted first; the rest of the item
+    is only extracted when the fingerprint is new, so mostly-seen feeds
+    skip building dicts for items that are thrown away.
+
+    Args:
+        content: Raw feed content
+        seen_fingerprints: Fingerprints of previously seen item GUIDs
+
+    Returns:
+        Tuple of (new items, fingerprints of every item in the feed)
+    """
+    new_items = []
+    fingerprints = []
+
+    for entry in _iter_feed_entries(content):
+        guid = _entry_guid(entry)
+        fingerprint = item_fingerprint(guid)
+        fingerprints.append(fingerprint)
+        if fingerprint not in seen_fingerprints:
+            new_items.append(_entry_to_item(entry, guid))
+
+    return new_items, fingerprints
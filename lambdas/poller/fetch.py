@@ -0,0 +1,231 @@
+"""URL fetching and content hashing for the poller.
+
+Bodies are streamed through a shared, pooled HTTP session and capped at
+MAX_BODY_BYTES. HTTP polls hash the body as it arrives, keeping only the
+head that goes into the trigger data, decoded with the response charset.
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+import requests
+from aws_lambda_powertools import Logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = Logger(child=True)
+
+CONTENT_HASH_BYTES = 16  # BLAKE2b digest size for content change detection
+LEGACY_HASH_LENGTH = 64  # Hex length of SHA-256 hashes in older poll state
+REQUEST_TIMEOUT = (5, 30)  # (connect, read) seconds; see SESSION for the budget
+MAX_BODY_BYTES = 8 * 1024 * 1024  # Hard cap on downloaded response size
+HTTP_TRIGGER_CONTENT_CHARS = 10000  # Text prefix included in HTTP trigger data
+DEFAULT_ENCODING = "utf-8"  # Used when a response declares no usable charset
+FETCH_CHUNK_SIZE = 64 * 1024
+USER_AGENT = "AutomationPlatform-Poller/1.0"
+
+# Shared HTTP session so warm containers reuse pooled keep-alive connections
+# instead of paying a TCP+TLS handshake on every fetch. Only connection
+# failures are retried: every attempt must fit inside the 60s Lambda timeout
+# (3 x 5s connect + one 30s read) so handle_failure still gets to run.
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = USER_AGENT
+_http_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, read=0, backoff_factor=0.2),
+)
+SESSION.mount("https://", _http_adapter)
+SESSION.mount("http://", _http_adapter)
+
+
+def hash_content(content: str | bytes) -> str:
+    """Generate a 128-bit BLAKE2b hash of content.
+
+    Only used to detect changes, so a fast non-cryptographic-strength digest
+    is enough and halves the stored hash size versus SHA-256.
+
+    Args:
+        content: Content to hash (str is UTF-8 encoded first)
+
+    Returns:
+        Hex digest (32 characters)
+    """
+    if isinstance(content, str):
+        content = content.encode()
+    return hashlib.blake2b(content, digest_size=CONTENT_HASH_BYTES).hexdigest()
+
+
+def digest_body(
+    chunks: Iterable[bytes],
+    encoding: str = DEFAULT_ENCODING,
+    legacy: bool = False,
+) -> tuple[str, int, str, str | None]:
+    """Hash a body chunk by chunk, keeping only the head for the trigger.
+
+    The head is decoded incrementally, so a character split across chunks
+    decodes whole and one cut off at the end of the body is dropped rather
+    than replaced.
+
+    The legacy hash matches what older poll state stored: SHA-256 of the
+    body decoded as ``response.text`` and re-encoded as UTF-8. requests
+    guessed the charset when none was declared; UTF-8 stands in for that
+    guess here.
+
+    Args:
+        chunks: Body chunks in order
+        encoding: Response charset used to decode the head
+        legacy: Also compute the SHA-256 hash used by older poll state
+
+    Returns:
+        Tuple of (first HTTP_TRIGGER_CONTENT_CHARS characters, total length
+        in bytes, content hash, legacy SHA-256 hash or None)
+    """
+    hasher = hashlib.blake2b(digest_size=CONTENT_HASH_BYTES)
+    legacy_hasher = hashlib.sha256() if legacy else None
+    legacy_decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    head: list[str] = []
+    head_chars = 0
+    length = 0
+
+    for chunk in chunks:
+        hasher.update(chunk)
+        if legacy_hasher is not None:
+            legacy_hasher.update(legacy_decoder.decode(chunk).encode())
+        if head_chars < HTTP_TRIGGER_CONTENT_CHARS:
+            text = decoder.decode(chunk)
+            head.append(text)
+            head_chars += len(text)
+        length += len(chunk)
+
+    legacy_hash = None
+    if legacy_hasher is not None:
+        legacy_hasher.update(legacy_decoder.decode(b"", final=True).encode())
+        legacy_hash = legacy_hasher.hexdigest()
+    head_text = "".join(head)[:HTTP_TRIGGER_CONTENT_CHARS]
+    return head_text, length, hasher.hexdigest(), legacy_hash
+
+
+def is_legacy_hash(last_hash: str | None) -> bool:
+    """Check whether a stored content hash predates the BLAKE2b switch."""
+    return last_hash is not None and len(last_hash) == LEGACY_HASH_LENGTH
+
+
+def http_changed(
+    length: int,
+    current_hash: str,
+    legacy_hash: str | None,
+    last_hash: str | None,
+    last_length: int | None,
+) -> bool:
+    """Compare a body digest with the previous poll's stored values."""
+    if last_hash is None:
+        return True
+
+    # A differing byte length proves a change without comparing hashes
+    if last_length is not None and length != last_length:
+        return True
+
+    if is_legacy_hash(last_hash):
+        # State written before the switch from SHA-256: compare against that
+        # once so the migration doesn't trigger every HTTP workflow
+        return legacy_hash != last_hash
+
+    return current_hash != last_hash
+
+
+# -----------------------------------------------------------------------------
+# URL Fetching
+# -----------------------------------------------------------------------------
+
+
+def _response_encoding(response: requests.Response) -> str:
+    """Get the charset requests would decode a response with.
+
+    Falls back to UTF-8 when no charset is known or it isn't a codec
+    Python has.
+    """
+    try:
+        return codecs.lookup(response.encoding or DEFAULT_ENCODING).name
+    except LookupError:
+        return DEFAULT_ENCODING
+
+
+def _iter_capped(response: requests.Response, url: str) -> Iterator[bytes]:
+    """Stream a response body, stopping at MAX_BODY_BYTES.
+
+    The cap means a runaway or malicious URL can't exhaust Lambda memory
+    or time.
+
+    Args:
+        response: Streaming response
+        url: URL being fetched, for the truncation warning
+
+    Yields:
+        Body chunks (decompressed)
+    """
+    remaining = MAX_BODY_BYTES
+    for chunk in response.iter_content(chunk_size=FETCH_CHUNK_SIZE):
+        if len(chunk) > remaining:
+            logger.warning("Response body truncated", url=url, max_bytes=MAX_BODY_BYTES)
+            yield chunk[:remaining]
+            return
+        remaining -= len(chunk)
+        yield chunk
+
+
+@contextmanager
+def _open_body(url: str) -> Iterator[tuple[Iterator[bytes], str]]:
+    """Open a streaming GET and provide its body chunks and charset.
+
+    Args:
+        url: URL to fetch
+
+    Yields:
+        Tuple of (body chunk iterator, response encoding)
+
+    Raises:
+        requests.RequestException: If request fails
+    """
+    with SESSION.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        yield _iter_capped(response, url), _response_encoding(response)
+
+
+def fetch_url(url: str) -> tuple[bytes, str]:
+    """Fetch content from URL.
+
+    Args:
+        url: URL to fetch
+
+    Returns:
+        Tuple of (raw response body, decompressed and at most
+        MAX_BODY_BYTES; response encoding)
+
+    Raises:
+        requests.RequestException: If request fails
+    """
+    with _open_body(url) as (chunks, encoding):
+        return b"".join(chunks), encoding
+
+
+def fetch_http_digest(url: str, legacy: bool = False) -> tuple[str, int, str, str | None]:
+    """Fetch a URL and hash it as it streams, without buffering the body.
+
+    Args:
+        url: URL to fetch
+        legacy: Also compute the SHA-256 hash used by older poll state
+
+    Returns:
+        Same tuple as digest_body
+
+    Raises:
+        requests.RequestException: If request fails
+    """
+    with _open_body(url) as (chunks, encoding):
+        return digest_body(chunks, encoding, legacy)
@@ -7,18 +7,37 @@ and queues workflow execution when changes are found.
 
 from __future__ import annotations
 
-import hashlib
-import json
+import logging
 import os
-import random
-import time
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable
 
-import boto3
-import feedparser
 import requests
-from aws_lambda_powertools import Logger, Tracer
+from aws_lambda_powertools import Logger
+
+import executions
+import failures
+import repository
+from executions import flush_executions, queue_execution
+from failures import handle_failure
+from feeds import parse_feed, parse_new_feed_items
+from fetch import (
+    DEFAULT_ENCODING,
+    SESSION,
+    digest_body,
+    fetch_http_digest,
+    fetch_url,
+    hash_content,
+    http_changed,
+    is_legacy_hash,
+)
+from repository import get_poll_state, get_workflow, now_iso, update_poll_state
+from seen_items import (
+    count_fingerprints,
+    load_seen_fingerprints,
+    pack_fingerprints,
+    prune_seen_ids,
+)
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.typing import LambdaContext
@@ -28,250 +47,71 @@ if TYPE_CHECKING:
 # -----------------------------------------------------------------------------
 
 logger = Logger(service="poller")
-tracer = Tracer(service="poller")
 
-# AWS clients
-dynamodb = boto3.resource("dynamodb")
-sqs_client = boto3.client("sqs")
-events_client = boto3.client("events")
+# Setting POWERTOOLS_TRACE_DISABLED skips importing the Tracer and wrapping
+# every traced function, trimming cold start and per-call overhead when
+# X-Ray isn't in use.
+if os.environ.get("POWERTOOLS_TRACE_DISABLED", "").lower() in ("1", "true"):
 
-# Environment variables
-WORKFLOWS_TABLE_NAME = os.environ.get("WORKFLOWS_TABLE_NAME", "dev-Workflows")
-POLL_STATE_TABLE_NAME = os.environ.get("POLL_STATE_TABLE_NAME", "dev-PollState")
-EXECUTION_QUEUE_URL = os.environ.get("EXECUTION_QUEUE_URL", "")
-DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL", "")
-ENVIRONMENT = os.environ.get("ENVIRONMENT", "dev")
+    def capture_method(func: Callable) -> Callable:
+        """No-op replacement for Tracer.capture_method."""
+        return func
 
-# Constants
-MAX_CONSECUTIVE_FAILURES = 4
-MAX_SEEN_ITEMS = 500
-MAX_FEED_ITEMS = 100  # Limit items to process per poll
-REQUEST_TIMEOUT = 30
-USER_AGENT = "AutomationPlatform-Poller/1.0"
-
-
-def generate_execution_id() -> str:
-    """Generate a ULID-style execution ID.
-
-    Returns:
-        Execution ID with 'ex_' prefix
-    """
-    timestamp = int(time.time() * 1000)
-    random_part = random.randint(0, 0xFFFFFFFFFF)
-    return f"ex_{timestamp:012x}{random_part:010x}"
-
-
-def now_iso() -> str:
-    """Get current UTC time as ISO string."""
-    return datetime.now(timezone.utc).isoformat()
-
-
-# -----------------------------------------------------------------------------
-# DynamoDB Operations
-# -----------------------------------------------------------------------------
-
-
-@tracer.capture_method
-def get_workflow(workflow_id: str) -> dict | None:
-    """Fetch workflow from DynamoDB.
-
-    Args:
-        workflow_id: Workflow identifier
-
-    Returns:
-        Workflow dict or None if not found
-    """
-    table = dynamodb.Table(WORKFLOWS_TABLE_NAME)
-    response = table.get_item(Key={"workflow_id": workflow_id})
-    return response.get("Item")
-
-
-@tracer.capture_method
-def get_poll_state(workflow_id: str) -> dict:
-    """Fetch poll state from DynamoDB.
-
-    Args:
-        workflow_id: Workflow identifier
-
-    Returns:
-        Poll state dict (empty dict if not found)
-    """
-    table = dynamodb.Table(POLL_STATE_TABLE_NAME)
-    response = table.get_item(Key={"workflow_id": workflow_id})
-    return response.get("Item", {})
-
-
-@tracer.capture_method
-def update_poll_state(workflow_id: str, updates: dict) -> None:
-    """Update poll state in DynamoDB.
+    capture_lambda_handler = capture_method
+else:
+    from aws_lambda_powertools import Tracer
 
-    Args:
-        workflow_id: Workflow identifier
-        updates: Fields to update
-    """
-    table = dynamodb.Table(POLL_STATE_TABLE_NAME)
-
-    # Build update expression
-    update_parts = []
-    expr_names = {}
-    expr_values = {}
-
-    for key, value in updates.items():
-        safe_key = f"#{key}"
-        value_key = f":{key}"
-        update_parts.append(f"{safe_key} = {value_key}")
-        expr_names[safe_key] = key
-        expr_values[value_key] = value
-
-    table.update_item(
-        Key={"workflow_id": workflow_id},
-        UpdateExpression="SET " + ", ".join(update_parts),
-        ExpressionAttributeNames=expr_names,
-        ExpressionAttributeValues=expr_values,
-    )
-
-
-@tracer.capture_method
-def disable_workflow(workflow_id: str) -> None:
-    """Disable workflow in DynamoDB.
-
-    Args:
-        workflow_id: Workflow identifier
-    """
-    table = dynamodb.Table(WORKFLOWS_TABLE_NAME)
-    table.update_item(
-        Key={"workflow_id": workflow_id},
-        UpdateExpression="SET #enabled = :enabled",
-        ExpressionAttributeNames={"#enabled": "enabled"},
-        ExpressionAttributeValues={":enabled": False},
-    )
-    logger.info("Workflow disabled", workflow_id=workflow_id)
-
-
-# -----------------------------------------------------------------------------
-# Feed Parsing
-# -----------------------------------------------------------------------------
+    tracer = Tracer(service="poller")
+    capture_method = tracer.capture_method
+    capture_lambda_handler = tracer.capture_lambda_handler
 
-
-def parse_feed(content: str) -> list[dict]:
-    """Parse RSS/Atom feed and return normalized items.
-
-    Args:
-        content: Raw feed content
-
-    Returns:
-        List of normalized item dicts with title, link, guid, published, summary
-    """
-    feed = feedparser.parse(content)
-    items = []
-
-    for entry in feed.entries[:MAX_FEED_ITEMS]:
-        # Get guid: prefer id, then guid, fallback to link
-        guid = entry.get("id") or entry.get("guid")
-        if isinstance(guid, dict):
-            guid = guid.get("value", "")
-        if not guid:
-            guid = entry.get("link", "")
-
-        item = {
-            "title": entry.get("title", ""),
-            "link": entry.get("link", ""),
-            "guid": str(guid),
-            "published": entry.get("published", ""),
-            "summary": (entry.get("summary", "") or "")[:500],
-        }
-        items.append(item)
-
-    return items
-
-
-def find_new_items(items: list[dict], seen_ids: list[str]) -> list[dict]:
-    """Filter to only items not in seen_ids.
-
-    Args:
-        items: List of parsed feed items
-        seen_ids: Previously seen item GUIDs
-
-    Returns:
-        List of new items not in seen_ids
-    """
-    seen_set = set(seen_ids)
-    return [item for item in items if item["guid"] not in seen_set]
-
-
-def prune_seen_ids(seen_ids: list[str], new_ids: list[str]) -> list[str]:
-    """Add new IDs and prune to MAX_SEEN_ITEMS, keeping most recent.
-
-    Args:
-        seen_ids: Current seen IDs list
-        new_ids: New IDs to add
-
-    Returns:
-        Pruned list with max MAX_SEEN_ITEMS entries
-    """
-    combined = seen_ids + new_ids
-    if len(combined) > MAX_SEEN_ITEMS:
-        return combined[-MAX_SEEN_ITEMS:]
-    return combined
+# Constants
+POLL_TRIGGER_TYPES = frozenset({"poll"})  # Trigger types this Lambda handles
+MAX_FETCH_WORKERS = 8  # Concurrent fetches for multi-workflow invocations
 
 
 # -----------------------------------------------------------------------------
-# HTTP Content Hashing
+# SnapStart
 # -----------------------------------------------------------------------------
 
+_WARMUP_FEED = "<rss version='2.0'><channel><item><guid>warmup</guid></item></channel></rss>"
 
-def hash_content(content: str) -> str:
-    """Generate SHA256 hash of content.
 
-    Args:
-        content: String content to hash
+def init_snapstart() -> None:
+    """Pre-initialize clients and the feed parser before the SnapStart snapshot.
 
-    Returns:
-        Hex digest of SHA256 hash
+    Only runs when Lambda is initializing a SnapStart version; ordinary cold
+    starts keep building clients lazily on first use.
     """
-    return hashlib.sha256(content.encode()).hexdigest()
+    if os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") != "snap-start":
+        return
 
+    repository._ddb()
+    executions._sqs()
+    failures._events()
+    parse_feed(_WARMUP_FEED)
 
-def check_http_changed(content: str, last_hash: str | None) -> tuple[bool, str]:
-    """Check if HTTP content has changed.
 
-    Args:
-        content: Current content
-        last_hash: Previous content hash (None if first check)
+def _refresh_clients() -> None:
+    """Drop clients captured in the snapshot so they pick up fresh credentials.
 
-    Returns:
-        Tuple of (changed, current_hash)
+    The default boto3 session keeps its loaded service models, so rebuilding
+    a client after restore is much cheaper than the first build.
     """
-    current_hash = hash_content(content)
-    changed = last_hash is None or current_hash != last_hash
-    return changed, current_hash
-
-
-# -----------------------------------------------------------------------------
-# URL Fetching
-# -----------------------------------------------------------------------------
-
-
-@tracer.capture_method
-def fetch_url(url: str) -> str:
-    """Fetch content from URL.
+    repository._ddb.cache_clear()
+    executions._sqs.cache_clear()
+    failures._events.cache_clear()
+    SESSION.close()
 
-    Args:
-        url: URL to fetch
 
-    Returns:
-        Response body as string
+try:
+    from snapshot_restore_py import register_after_restore
+except ImportError:  # Not running on a SnapStart-capable Lambda runtime
+    pass
+else:
+    register_after_restore(_refresh_clients)
 
-    Raises:
-        requests.RequestException: If request fails
-    """
-    response = requests.get(
-        url,
-        timeout=REQUEST_TIMEOUT,
-        headers={"User-Agent": USER_AGENT},
-    )
-    response.raise_for_status()
-    return response.text
+init_snapstart()
 
 
 # -----------------------------------------------------------------------------
@@ -279,11 +119,12 @@ def fetch_url(url: str) -> str:
 # -----------------------------------------------------------------------------
 
 
-@tracer.capture_method
+@capture_method
 def poll_feed(
     url: str,
     content_type: str,
     poll_state: dict,
+    content: bytes | None = None,
 ) -> tuple[list[dict], dict]:
     """Poll RSS/Atom feed for new items.
 
@@ -291,74 +132,108 @@ def poll_feed(
         url: Feed URL
         content_type: "rss" or "atom"
         poll_state: Current poll state
+        content: Already-fetched feed body (fetched here if None)
 
     Returns:
         Tuple of (new_items, state_updates)
     """
-    content = fetch_url(url)
-    items = parse_feed(content)
+    if content is None:
+        # The XML declaration, not the HTTP charset, decides the feed encoding
+        content, _ = fetch_url(url)
+
+    # Many origins ignore conditional requests, so compare the raw body with
+    # the previous poll and skip parsing entirely when nothing changed
+    feed_hash = hash_content(content)
+    if feed_hash == poll_state.get("last_feed_hash"):
+        logger.info("Feed unchanged, skipping parse", url=url)
+        return [], {
+            "last_checked_at": now_iso(),
+            "consecutive_failures": 0,
+            "last_error": None,
+        }
 
-    seen_ids = poll_state.get("seen_item_ids", [])
-    new_items = find_new_items(items, seen_ids)
+    seen_fingerprints = load_seen_fingerprints(poll_state)
+    new_items, all_item_fingerprints = parse_new_feed_items(content, set(seen_fingerprints))
 
-    # Update seen IDs with all current items (not just new ones)
-    all_item_ids = [item["guid"] for item in items]
-    updated_seen_ids = prune_seen_ids(seen_ids, all_item_ids)
+    # Update seen fingerprints with all current items (not just new ones)
+    updated_fingerprints = prune_seen_ids(seen_fingerprints, all_item_fingerprints)
 
     state_updates = {
-        "seen_item_ids": updated_seen_ids,
+        "seen_item_hashes": pack_fingerprints(updated_fingerprints),
+        "last_feed_hash": feed_hash,
         "last_checked_at": now_iso(),
         "consecutive_failures": 0,
         "last_error": None,
     }
-
-    logger.info(
-        "Feed polled",
-        url=url,
-        content_type=content_type,
-        total_items=len(items),
-        new_items=len(new_items),
-    )
+    if poll_state.get("seen_item_ids"):
+        # Drop the legacy GUID list once it has been migrated
+        state_updates["seen_item_ids"] = None
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Feed polled",
+            url=url,
+            content_type=content_type,
+            total_items=len(all_item_fingerprints),
+            new_items=len(new_items),
+        )
 
     return new_items, state_updates
 
 
-@tracer.capture_method
-def poll_http(url: str, poll_state: dict) -> tuple[dict | None, dict]:
+@capture_method
+def poll_http(
+    url: str,
+    poll_state: dict,
+    content: bytes | None = None,
+    encoding: str = DEFAULT_ENCODING,
+) -> tuple[dict | None, dict]:
     """Poll HTTP URL for content changes.
 
     Args:
         url: URL to poll
         poll_state: Current poll state
+        content: Already-fetched response body (fetched here if None)
+        encoding: Charset of an already-fetched body
 
     Returns:
         Tuple of (trigger_data if changed else None, state_updates)
     """
-    content = fetch_url(url)
     last_hash = poll_state.get("last_content_hash")
+    legacy = is_legacy_hash(last_hash)
+
+    if content is None:
+        # Hash while streaming; only the head needed for the trigger is kept
+        head, length, current_hash, legacy_hash = fetch_http_digest(url, legacy)
+    else:
+        head, length, current_hash, legacy_hash = digest_body([content], encoding, legacy)
 
-    changed, current_hash = check_http_changed(content, last_hash)
+    changed = http_changed(
+        length, current_hash, legacy_hash, last_hash, poll_state.get("last_content_length")
+    )
 
     state_updates = {
         "last_content_hash": current_hash,
+        "last_content_length": length,
         "last_checked_at": now_iso(),
         "consecutive_failures": 0,
         "last_error": None,
     }
 
-    logger.info(
-        "HTTP polled",
-        url=url,
-        changed=changed,
-        first_poll=last_hash is None,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "HTTP polled",
+            url=url,
+            changed=changed,
+            first_poll=last_hash is None,
+        )
 
     if changed and last_hash is not None:
         # Only trigger on change, not first poll
         trigger_data = {
             "type": "poll",
             "content_type": "http",
-            "content": content[:10000],  # Limit content size
+            "content": head,
             "content_hash": current_hash,
         }
         return trigger_data, state_updates
@@ -367,257 +242,234 @@ def poll_http(url: str, poll_state: dict) -> tuple[dict | None, dict]:
 
 
 # -----------------------------------------------------------------------------
-# Execution Queueing
+# Main Handler
 # -----------------------------------------------------------------------------
 
 
-@tracer.capture_method
-def queue_execution(
-    workflow_id: str,
-    trigger_data: dict,
-) -> str:
-    """Send execution request to SQS queue.
+def resolve_poll_config(workflow_id: str) -> tuple[dict | None, dict | None]:
+    """Load a workflow and validate its poll trigger configuration.
 
     Args:
         workflow_id: Workflow identifier
-        trigger_data: Poll trigger data
 
     Returns:
-        Generated execution ID
+        Tuple of (poll config with url and content_type, None) when the
+        workflow should be polled, or (None, skip result) otherwise
     """
-    execution_id = generate_execution_id()
+    logger.append_keys(workflow_id=workflow_id)
 
-    message = {
-        "workflow_id": workflow_id,
-        "execution_id": execution_id,
-        "trigger_type": "poll",
-        "trigger_data": trigger_data,
-    }
+    # Get workflow
+    workflow = get_workflow(workflow_id)
+    if not workflow:
+        logger.warning("Workflow not found")
+        return None, {"status": "skipped", "reason": "workflow_not_found"}
 
-    sqs_client.send_message(
-        QueueUrl=EXECUTION_QUEUE_URL,
-        MessageBody=json.dumps(message),
-    )
+    enabled = workflow.get("enabled", True)
+    trigger = workflow.get("trigger") or {}
+    trigger_type = trigger.get("type")
 
-    logger.info(
-        "Execution queued",
-        workflow_id=workflow_id,
-        execution_id=execution_id,
-    )
+    # Check if enabled
+    if not enabled:
+        logger.info("Workflow disabled, skipping")
+        return None, {"status": "skipped", "reason": "workflow_disabled"}
 
-    return execution_id
+    # Verify trigger type
+    if trigger_type not in POLL_TRIGGER_TYPES:
+        logger.warning(
+            "Workflow trigger type is not poll",
+            trigger_type=trigger_type,
+        )
+        return None, {"status": "skipped", "reason": "not_poll_trigger"}
+
+    # Get poll configuration
+    config = trigger.get("config", {})
+    url = config.get("url", "")
+    content_type = config.get("content_type", "rss")
 
+    if not url:
+        logger.error("No URL in poll config")
+        return None, {"status": "error", "reason": "missing_url"}
 
-# -----------------------------------------------------------------------------
-# Failure Handling
-# -----------------------------------------------------------------------------
+    return {"url": url, "content_type": content_type}, None
 
 
-def get_poll_rule_name(workflow_id: str) -> str:
-    """Get EventBridge rule name for poll trigger.
+def run_poll(
+    workflow_id: str,
+    poll_config: dict,
+    pending: list[dict],
+    prefetched: Future | None = None,
+) -> dict[str, Any]:
+    """Poll a workflow's URL and buffer an execution if it changed.
 
     Args:
         workflow_id: Workflow identifier
+        poll_config: Config from resolve_poll_config
+        pending: Per-invocation list of buffered executions
+        prefetched: Future for a fetch already started on a worker thread
 
     Returns:
-        Rule name
+        Status dict with result information
     """
-    return f"automations-{ENVIRONMENT}-{workflow_id}-poll"
-
+    url = poll_config["url"]
+    content_type = poll_config["content_type"]
+    # Re-bind the log context: batch polls resolve every workflow first
+    logger.append_keys(workflow_id=workflow_id)
 
-@tracer.capture_method
-def disable_eventbridge_rule(workflow_id: str) -> None:
-    """Disable EventBridge poll rule.
+    # Get current poll state
+    poll_state = get_poll_state(workflow_id)
 
-    Args:
-        workflow_id: Workflow identifier
-    """
-    rule_name = get_poll_rule_name(workflow_id)
     try:
-        events_client.disable_rule(Name=rule_name)
-        logger.info("EventBridge rule disabled", rule_name=rule_name)
-    except events_client.exceptions.ResourceNotFoundException:
-        logger.warning("Rule not found", rule_name=rule_name)
+        content, encoding = prefetched.result() if prefetched else (None, DEFAULT_ENCODING)
 
+        if content_type in ("rss", "atom"):
+            # Poll RSS/Atom feed
+            new_items, state_updates = poll_feed(url, content_type, poll_state, content)
 
-@tracer.capture_method
-def send_discord_notification(
-    workflow_id: str,
-    error: str,
-    failures: int,
-) -> None:
-    """Send Discord notification about auto-disabled workflow.
+            if new_items:
+                trigger_data = {
+                    "type": "poll",
+                    "content_type": content_type,
+                    "items": new_items,
+                }
+                # State is saved by flush_executions once the message is queued
+                execution_id = queue_execution(
+                    workflow_id, trigger_data, poll_state, state_updates, pending
+                )
+                return {
+                    "status": "triggered",
+                    "execution_id": execution_id,
+                    "new_items": len(new_items),
+                }
+            else:
+                update_poll_state(workflow_id, state_updates)
+                if "seen_item_hashes" in state_updates:
+                    items_checked = count_fingerprints(state_updates["seen_item_hashes"])
+                else:
+                    # Unchanged feed skipped parsing; the stored list still applies
+                    items_checked = len(load_seen_fingerprints(poll_state))
+                return {"status": "no_changes", "items_checked": items_checked}
 
-    Args:
-        workflow_id: Workflow identifier
-        error: Last error message
-        failures: Number of consecutive failures
-    """
-    if not DISCORD_WEBHOOK_URL:
-        logger.warning("No DISCORD_WEBHOOK_URL configured, skipping notification")
-        return
+        else:
+            # Poll HTTP content
+            trigger_data, state_updates = poll_http(url, poll_state, content, encoding)
 
-    try:
-        message = (
-            f"Workflow `{workflow_id}` auto-disabled after {failures} "
-            f"consecutive polling failures.\nLast error: {error[:500]}"
-        )
+            if trigger_data:
+                execution_id = queue_execution(
+                    workflow_id, trigger_data, poll_state, state_updates, pending
+                )
+                return {
+                    "status": "triggered",
+                    "execution_id": execution_id,
+                }
+            else:
+                update_poll_state(workflow_id, state_updates)
+                return {"status": "no_changes"}
 
-        requests.post(
-            DISCORD_WEBHOOK_URL,
-            json={"content": message},
-            timeout=10,
-        )
-        logger.info("Discord notification sent", workflow_id=workflow_id)
+    except requests.RequestException as e:
+        handle_failure(workflow_id, poll_state, f"Request failed: {e}")
+        return {"status": "failed", "error": str(e)}
     except Exception as e:
-        logger.warning("Failed to send Discord notification", error=str(e))
+        handle_failure(workflow_id, poll_state, f"Unexpected error: {e}")
+        logger.exception("Unexpected error during poll")
+        return {"status": "failed", "error": str(e)}
 
 
-@tracer.capture_method
-def handle_failure(
-    workflow_id: str,
-    poll_state: dict,
-    error: str,
-) -> None:
-    """Handle poll failure, auto-disable after threshold.
+def poll_workflow(workflow_id: str, pending: list[dict]) -> dict[str, Any]:
+    """Poll a single workflow and buffer an execution if it changed.
 
     Args:
         workflow_id: Workflow identifier
-        poll_state: Current poll state
-        error: Error message
+        pending: Per-invocation list of buffered executions
+
+    Returns:
+        Status dict with result information
     """
-    failures = poll_state.get("consecutive_failures", 0) + 1
+    poll_config, skipped = resolve_poll_config(workflow_id)
+    if skipped:
+        return skipped
+    return run_poll(workflow_id, poll_config, pending)
 
-    logger.warning(
-        "Poll failed",
-        workflow_id=workflow_id,
-        consecutive_failures=failures,
-        error=error,
-    )
 
-    update_poll_state(
-        workflow_id,
-        {
-            "consecutive_failures": failures,
-            "last_error": error[:1000],
-            "last_checked_at": now_iso(),
-        },
-    )
+def poll_workflows(workflow_ids: list[str], pending: list[dict]) -> dict[str, dict]:
+    """Poll several workflows, fetching their URLs concurrently.
 
-    if failures >= MAX_CONSECUTIVE_FAILURES:
-        logger.error(
-            "Max failures reached, auto-disabling workflow",
-            workflow_id=workflow_id,
-            failures=failures,
-        )
-        disable_workflow(workflow_id)
-        disable_eventbridge_rule(workflow_id)
-        send_discord_notification(workflow_id, error, failures)
+    Only the network fetch runs on worker threads; parsing, hashing and
+    state updates stay on the calling thread to keep memory bounded. Each
+    workflow is processed as soon as its fetch lands, so one slow origin
+    doesn't hold up the others.
 
+    Args:
+        workflow_ids: Workflow identifiers
+        pending: Per-invocation list of buffered executions
 
-# -----------------------------------------------------------------------------
-# Main Handler
-# -----------------------------------------------------------------------------
+    Returns:
+        Mapping of workflow_id to its status dict
+    """
+    results: dict[str, dict] = {}
+    poll_configs: dict[str, dict] = {}
+
+    for workflow_id in workflow_ids:
+        poll_config, skipped = resolve_poll_config(workflow_id)
+        if skipped:
+            results[workflow_id] = skipped
+        else:
+            poll_configs[workflow_id] = poll_config
+
+    if poll_configs:
+        workers = min(MAX_FETCH_WORKERS, len(poll_configs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetches = {
+                pool.submit(fetch_url, poll_config["url"]): workflow_id
+                for workflow_id, poll_config in poll_configs.items()
+            }
+            for fetch in as_completed(fetches):
+                workflow_id = fetches[fetch]
+                results[workflow_id] = run_poll(
+                    workflow_id, poll_configs[workflow_id], pending, fetch
+                )
+
+    return {workflow_id: results[workflow_id] for workflow_id in workflow_ids}
 
 
 @logger.inject_lambda_context
-@tracer.capture_lambda_handler
+@capture_lambda_handler
 def handler(event: dict, context: LambdaContext) -> dict[str, Any]:
     """Handle EventBridge scheduled invocation for polling.
 
+    The event normally carries a single ``workflow_id``. A ``workflow_ids``
+    list is also accepted so several workflows can share one invocation;
+    their executions are then queued together in SQS batches.
+
     Args:
-        event: EventBridge event with workflow_id and time
+        event: EventBridge event with workflow_id (or workflow_ids) and time
         context: Lambda context
 
     Returns:
         Status dict with result information
     """
     workflow_id = event.get("workflow_id")
+    workflow_ids = event.get("workflow_ids")
     scheduled_time = event.get("time")
 
+    # Bound once so child log calls don't repeat it; None values are dropped
+    logger.append_keys(workflow_id=workflow_id)
     logger.info(
         "Poll trigger received",
-        workflow_id=workflow_id,
+        workflow_ids=workflow_ids,
         scheduled_time=scheduled_time,
     )
 
     # Validate workflow_id
-    if not workflow_id:
+    if not workflow_id and not workflow_ids:
         logger.error("No workflow_id in event")
         return {"status": "error", "reason": "missing_workflow_id"}
 
-    # Get workflow
-    workflow = get_workflow(workflow_id)
-    if not workflow:
-        logger.warning("Workflow not found", workflow_id=workflow_id)
-        return {"status": "skipped", "reason": "workflow_not_found"}
-
-    # Check if enabled
-    if not workflow.get("enabled", True):
-        logger.info("Workflow disabled, skipping", workflow_id=workflow_id)
-        return {"status": "skipped", "reason": "workflow_disabled"}
-
-    # Verify trigger type
-    trigger = workflow.get("trigger", {})
-    if trigger.get("type") != "poll":
-        logger.warning(
-            "Workflow trigger type is not poll",
-            workflow_id=workflow_id,
-            trigger_type=trigger.get("type"),
-        )
-        return {"status": "skipped", "reason": "not_poll_trigger"}
-
-    # Get poll configuration
-    config = trigger.get("config", {})
-    url = config.get("url", "")
-    content_type = config.get("content_type", "rss")
+    pending: list[dict] = []
 
-    if not url:
-        logger.error("No URL in poll config", workflow_id=workflow_id)
-        return {"status": "error", "reason": "missing_url"}
+    if workflow_ids:
+        results = poll_workflows(workflow_ids, pending)
+        results.update(flush_executions(pending))
+        return {"status": "batch", "results": results}
 
-    # Get current poll state
-    poll_state = get_poll_state(workflow_id)
-
-    try:
-        if content_type in ("rss", "atom"):
-            # Poll RSS/Atom feed
-            new_items, state_updates = poll_feed(url, content_type, poll_state)
-            update_poll_state(workflow_id, state_updates)
-
-            if new_items:
-                trigger_data = {
-                    "type": "poll",
-                    "content_type": content_type,
-                    "items": new_items,
-                }
-                execution_id = queue_execution(workflow_id, trigger_data)
-                return {
-                    "status": "triggered",
-                    "execution_id": execution_id,
-                    "new_items": len(new_items),
-                }
-            else:
-                return {"status": "no_changes", "items_checked": len(state_updates.get("seen_item_ids", []))}
-
-        else:
-            # Poll HTTP content
-            trigger_data, state_updates = poll_http(url, poll_state)
-            update_poll_state(workflow_id, state_updates)
-
-            if trigger_data:
-                execution_id = queue_execution(workflow_id, trigger_data)
-                return {
-                    "status": "triggered",
-                    "execution_id": execution_id,
-                }
-            else:
-                return {"status": "no_changes"}
-
-    except requests.RequestException as e:
-        handle_failure(workflow_id, poll_state, f"Request failed: {e}")
-        return {"status": "failed", "error": str(e)}
-    except Exception as e:
-        handle_failure(workflow_id, poll_state, f"Unexpected error: {e}")
-        logger.exception("Unexpected error during poll")
-        return {"status": "failed", "error": str(e)}
+    result = poll_workflow(workflow_id, pending)
+    return flush_executions(pending).get(workflow_id, result)
@@ -0,0 +1,118 @@
+"""DynamoDB access for the poller.
+
+The poller talks to DynamoDB through the low-level client rather than the
+resource layer; items are (de)serialized explicitly with boto3's type
+serializers.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from datetime import datetime, timezone
+
+import boto3
+from aws_lambda_powertools import Logger
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+logger = Logger(child=True)
+
+WORKFLOWS_TABLE_NAME = os.environ.get("WORKFLOWS_TABLE_NAME", "dev-Workflows")
+POLL_STATE_TABLE_NAME = os.environ.get("POLL_STATE_TABLE_NAME", "dev-PollState")
+
+_serialize = TypeSerializer().serialize
+_deserialize = TypeDeserializer().deserialize
+
+
+@functools.cache
+def _ddb():
+    """Get the low-level DynamoDB client, built on first use."""
+    return boto3.client("dynamodb")
+
+
+def _from_item(item: dict) -> dict:
+    """Convert a DynamoDB-typed item into plain Python values."""
+    return {key: _deserialize(value) for key, value in item.items()}
+
+
+def now_iso() -> str:
+    """Get current UTC time as ISO string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def get_workflow(workflow_id: str) -> dict | None:
+    """Fetch workflow from DynamoDB.
+
+    Args:
+        workflow_id: Workflow identifier
+
+    Returns:
+        Workflow dict or None if not found
+    """
+    response = _ddb().get_item(
+        TableName=WORKFLOWS_TABLE_NAME,
+        Key={"workflow_id": {"S": workflow_id}},
+    )
+    item = response.get("Item")
+    return _from_item(item) if item else None
+
+
+def get_poll_state(workflow_id: str) -> dict:
+    """Fetch poll state from DynamoDB.
+
+    Args:
+        workflow_id: Workflow identifier
+
+    Returns:
+        Poll state dict (empty dict if not found)
+    """
+    response = _ddb().get_item(
+        TableName=POLL_STATE_TABLE_NAME,
+        Key={"workflow_id": {"S": workflow_id}},
+    )
+    item = response.get("Item")
+    return _from_item(item) if item else {}
+
+
+def update_poll_state(workflow_id: str, updates: dict) -> None:
+    """Update poll state in DynamoDB.
+
+    Args:
+        workflow_id: Workflow identifier
+        updates: Fields to update
+    """
+    # Build update expression
+    update_parts = []
+    expr_names = {}
+    expr_values = {}
+
+    for key, value in updates.items():
+        safe_key = f"#{key}"
+        value_key = f":{key}"
+        update_parts.append(f"{safe_key} = {value_key}")
+        expr_names[safe_key] = key
+        expr_values[value_key] = _serialize(value)
+
+    _ddb().update_item(
+        TableName=POLL_STATE_TABLE_NAME,
+        Key={"workflow_id": {"S": workflow_id}},
+        UpdateExpression="SET " + ", ".join(update_parts),
+        ExpressionAttributeNames=expr_names,
+        ExpressionAttributeValues=expr_values,
+    )
+
+
+def disable_workflow(workflow_id: str) -> None:
+    """Disable workflow in DynamoDB.
+
+    Args:
+        workflow_id: Workflow identifier
+    """
+    _ddb().update_item(
+        TableName=WORKFLOWS_TABLE_NAME,
+        Key={"workflow_id": {"S": workflow_id}},
+        UpdateExpression="SET #enabled = :enabled",
+        ExpressionAttributeNames={"#enabled": "enabled"},
+        ExpressionAttributeValues={":enabled": {"BOOL": False}},
+    )
+    logger.info("Workflow disabled")
@@ -11,6 +11,10 @@ os.environ["EXECUTION_QUEUE_URL"] = "https://sqs.us-east-1.amazonaws.com/1234567
 os.environ["DISCORD_WEBHOOK_URL"] = "https://discord.com/api/webhooks/test/test"
 os.environ["ENVIRONMENT"] = "test"
 os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+os.environ["POWERTOOLS_SERVICE_NAME"] = "poller"
+
+# The helper modules log through child loggers of the handler's "poller" logger
+import handler  # noqa: E402, F401
 
 
 @pytest.fixture
@@ -0,0 +1,112 @@
+"""Unit tests for poller execution queueing."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+
+class TestQueueExecution:
+    """Tests for execution queueing."""
+
+    def test_queue_execution_buffers_message(self):
+        """Test that queue_execution only buffers a batch entry and its state."""
+        from executions import queue_execution
+
+        pending = []
+        state_updates = {"last_content_hash": "abc"}
+        execution_id = queue_execution(
+            "wf_test", {"type": "poll"}, {}, state_updates, pending
+        )
+
+        assert execution_id.startswith("ex_")
+        assert len(pending) == 1
+        assert pending[0]["entry"]["Id"] == execution_id
+        assert pending[0]["state_updates"] is state_updates
+        message = json.loads(pending[0]["entry"]["MessageBody"])
+        assert message["workflow_id"] == "wf_test"
+        assert message["trigger_type"] == "poll"
+
+    @patch("executions.update_poll_state")
+    @patch("executions._sqs")
+    def test_flush_executions_chunks_batches(self, mock_sqs, mock_update_state):
+        """Test that buffered entries are sent in batches of 10, then saved."""
+        from executions import flush_executions, queue_execution
+
+        mock_client = MagicMock()
+        mock_client.send_message_batch.return_value = {"Successful": [], "Failed": []}
+        mock_sqs.return_value = mock_client
+
+        pending = []
+        for i in range(12):
+            queue_execution(f"wf_{i}", {"type": "poll"}, {}, {"n": i}, pending)
+
+        assert flush_executions(pending) == {}
+
+        assert mock_client.send_message_batch.call_count == 2
+        batches = [c.kwargs["Entries"] for c in mock_client.send_message_batch.call_args_list]
+        assert [len(b) for b in batches] == [10, 2]
+        assert set(batches[0][0]) == {"Id", "MessageBody"}
+        assert mock_update_state.call_count == 12
+
+    @patch("executions.update_poll_state")
+    @patch("executions._sqs")
+    def test_flush_executions_splits_oversized_batches(self, mock_sqs, mock_update_state):
+        """Test that a batch is closed before its bodies exceed the SQS payload limit."""
+        from executions import SQS_BATCH_MAX_BYTES, flush_executions, queue_execution
+
+        mock_sqs.return_value.send_message_batch.return_value = {"Failed": []}
+        content = "x" * (SQS_BATCH_MAX_BYTES // 3)
+
+        pending = []
+        for i in range(4):
+            queue_execution(f"wf_{i}", {"content": content}, {}, {"n": i}, pending)
+
+        assert flush_executions(pending) == {}
+
+        calls = mock_sqs.return_value.send_message_batch.call_args_list
+        batches = [c.kwargs["Entries"] for c in calls]
+        assert [len(b) for b in batches] == [2, 2]
+        for batch in batches:
+            assert sum(len(e["MessageBody"].encode()) for e in batch) <= SQS_BATCH_MAX_BYTES
+
+    @patch("executions.handle_failure")
+    @patch("executions.update_poll_state")
+    @patch("executions._sqs")
+    def test_flush_executions_send_error_fails_workflows(
+        self, mock_sqs, mock_update_state, mock_handle_failure
+    ):
+        """Test that a raising batch send records failures and saves no state."""
+        from executions import flush_executions, queue_execution
+
+        mock_sqs.return_value.send_message_batch.side_effect = RuntimeError("throttled")
+        poll_state = {"consecutive_failures": 0}
+
+        pending = []
+        queue_execution("wf_a", {"type": "poll"}, poll_state, {"n": 1}, pending)
+
+        failures = flush_executions(pending)
+
+        assert failures == {"wf_a": {"status": "failed", "error": "throttled"}}
+        mock_update_state.assert_not_called()
+        mock_handle_failure.assert_called_once_with("wf_a", poll_state, "Queue failed: throttled")
+
+    @patch("executions.handle_failure")
+    @patch("executions.update_poll_state")
+    @patch("executions._sqs")
+    def test_flush_executions_partial_batch_failure(
+        self, mock_sqs, mock_update_state, mock_handle_failure
+    ):
+        """Test that only the entries SQS rejected are failed."""
+        from executions import flush_executions, queue_execution
+
+        pending = []
+        queue_execution("wf_ok", {"type": "poll"}, {}, {"n": 1}, pending)
+        failed_id = queue_execution("wf_bad", {"type": "poll"}, {}, {"n": 2}, pending)
+        mock_sqs.return_value.send_message_batch.return_value = {
+            "Failed": [{"Id": failed_id, "Code": "InternalError", "Message": "boom"}],
+        }
+
+        failures = flush_executions(pending)
+
+        assert failures == {"wf_bad": {"status": "failed", "error": "boom"}}
+        mock_update_state.assert_called_once_with("wf_ok", {"n": 1})
+        mock_handle_failure.assert_called_once_with("wf_bad", {}, "Queue failed: boom")
@@ -0,0 +1,82 @@
+"""Unit tests for poller failure handling."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+class TestFailureHandling:
+    """Tests for failure handling."""
+
+    @patch("failures.send_discord_notification")
+    @patch("failures.disable_eventbridge_rule")
+    @patch("failures.disable_workflow")
+    @patch("failures.update_poll_state")
+    def test_handle_failure_increments_counter(
+        self, mock_update_state, mock_disable_wf, mock_disable_rule, mock_discord
+    ):
+        """Test that failure counter increments."""
+        from failures import handle_failure
+
+        poll_state = {"consecutive_failures": 1}
+
+        handle_failure("wf_test", poll_state, "Connection error")
+
+        mock_update_state.assert_called_once()
+        call_args = mock_update_state.call_args[0]
+        assert call_args[1]["consecutive_failures"] == 2
+        mock_disable_wf.assert_not_called()
+
+    @patch("failures.send_discord_notification")
+    @patch("failures.disable_eventbridge_rule")
+    @patch("failures.disable_workflow")
+    @patch("failures.update_poll_state")
+    def test_auto_disable_after_four_failures(
+        self, mock_update_state, mock_disable_wf, mock_disable_rule, mock_discord
+    ):
+        """Test auto-disable after 4 consecutive failures."""
+        from failures import handle_failure
+
+        poll_state = {"consecutive_failures": 3}  # Will become 4
+
+        handle_failure("wf_test", poll_state, "Connection error")
+
+        mock_update_state.assert_called_once()
+        mock_disable_wf.assert_called_once_with("wf_test")
+        mock_disable_rule.assert_called_once_with("wf_test")
+        mock_discord.assert_called_once()
+
+    @patch("failures.send_discord_notification")
+    @patch("failures.disable_eventbridge_rule")
+    @patch("failures.disable_workflow")
+    @patch("failures.update_poll_state")
+    def test_auto_disable_propagates_errors(
+        self, mock_update_state, mock_disable_wf, mock_disable_rule, mock_discord
+    ):
+        """Test that errors from the concurrent disable calls are re-raised."""
+        from failures import handle_failure
+
+        mock_disable_wf.side_effect = RuntimeError("DynamoDB unavailable")
+
+        with pytest.raises(RuntimeError, match="DynamoDB unavailable"):
+            handle_failure("wf_test", {"consecutive_failures": 3}, "Connection error")
+
+        mock_disable_rule.assert_called_once_with("wf_test")
+        mock_discord.assert_called_once()
+
+    @patch("failures.SESSION.post")
+    def test_send_discord_notification(self, mock_post):
+        """Test Discord notification sending."""
+        from failures import send_discord_notification
+
+        mock_post.return_value = MagicMock(status_code=204)
+
+        send_discord_notification("wf_test", "Test error", 4)
+
+        mock_post.assert_called_once()
+        call_args = mock_post.call_args
+        body = json.loads(call_args[1]["data"])
+        assert "wf_test" in body["content"]
+        assert "4" in body["content"]
+        assert call_args[1]["headers"]["Content-Type"] == "application/json"
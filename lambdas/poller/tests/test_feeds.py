@@ -0,0 +1,126 @@
+"""Unit tests for poller feed parsing."""
+
+from unittest.mock import patch
+
+
+class TestParseFeed:
+    """Tests for parse_feed function."""
+
+    def test_parse_rss_feed(self, sample_rss_feed):
+        """Test parsing standard RSS 2.0 feed."""
+        from feeds import parse_feed
+
+        items = parse_feed(sample_rss_feed)
+
+        assert len(items) == 2
+        assert items[0]["title"] == "First Article"
+        assert items[0]["link"] == "https://example.com/article1"
+        assert items[0]["guid"] == "guid-001"
+        assert items[1]["guid"] == "guid-002"
+
+    def test_parse_atom_feed(self, sample_atom_feed):
+        """Test parsing Atom feed with id elements."""
+        from feeds import parse_feed
+
+        items = parse_feed(sample_atom_feed)
+
+        assert len(items) == 2
+        assert items[0]["title"] == "Atom Article 1"
+        assert items[0]["link"] == "https://example.com/atom1"
+        assert items[0]["guid"] == "urn:uuid:atom-001"
+
+    def test_parse_atom_feed_fallback_link(self, sample_atom_feed_no_id):
+        """Test fallback to link when no id element."""
+        from feeds import parse_feed
+
+        items = parse_feed(sample_atom_feed_no_id)
+
+        assert len(items) == 1
+        assert items[0]["guid"] == "https://example.com/no-id-article"
+
+    def test_parse_empty_feed(self):
+        """Test parsing empty feed."""
+        from feeds import parse_feed
+
+        items = parse_feed("<rss><channel></channel></rss>")
+        assert items == []
+
+    def test_parse_feed_from_bytes(self, sample_rss_feed):
+        """Test parsing raw response bytes."""
+        from feeds import parse_feed
+
+        items = parse_feed(sample_rss_feed.encode())
+
+        assert [item["guid"] for item in items] == ["guid-001", "guid-002"]
+        assert items[0]["summary"] == "First article summary"
+        assert items[0]["published"] == "Sat, 21 Dec 2025 10:00:00 GMT"
+
+    def test_parse_feed_caps_items(self):
+        """Test that parsing stops after MAX_FEED_ITEMS entries."""
+        from feeds import parse_feed
+
+        entries = "".join(f"<item><guid>g{i}</guid></item>" for i in range(5))
+
+        with patch("feeds.MAX_FEED_ITEMS", 3):
+            items = parse_feed(f"<rss><channel>{entries}</channel></rss>")
+
+        assert [item["guid"] for item in items] == ["g0", "g1", "g2"]
+
+    def test_parse_feed_keeps_nested_entries_in_parent(self):
+        """Test that an <item> nested in an item is not split out or cleared."""
+        from feeds import parse_feed
+
+        feed = (
+            "<rss><channel><item>"
+            "<title>Outer</title><guid>outer</guid>"
+            "<ext><item>inner</item></ext>"
+            "<description>Outer summary</description>"
+            "</item></channel></rss>"
+        )
+
+        items = parse_feed(feed)
+
+        assert [item["guid"] for item in items] == ["outer"]
+        assert items[0]["title"] == "Outer"
+        assert items[0]["summary"] == "Outer summary"
+
+    def test_parse_atom_summary_falls_back_to_content(self):
+        """Test that an Atom entry with only <content> uses it as the summary."""
+        from feeds import parse_feed
+
+        feed = (
+            '<feed xmlns="http://www.w3.org/2005/Atom"><entry>'
+            "<id>urn:a</id><content>Full article text</content>"
+            "</entry></feed>"
+        )
+
+        assert parse_feed(feed)[0]["summary"] == "Full article text"
+
+    def test_parse_rss_link_falls_back_to_permalink_guid(self):
+        """Test that an RSS item without <link> uses its permalink guid."""
+        from feeds import parse_feed
+
+        feed = (
+            "<rss><channel>"
+            "<item><guid>https://example.com/a</guid></item>"
+            '<item><guid isPermaLink="false">tag-b</guid></item>'
+            "</channel></rss>"
+        )
+
+        items = parse_feed(feed)
+
+        assert items[0]["link"] == "https://example.com/a"
+        assert items[1]["link"] == ""
+
+    def test_parse_new_feed_items_skips_seen(self, sample_rss_feed):
+        """Test that seen items are fingerprinted but not built into dicts."""
+        from feeds import parse_new_feed_items
+        from seen_items import item_fingerprint
+
+        seen = {item_fingerprint("guid-001")}
+
+        new_items, fingerprints = parse_new_feed_items(sample_rss_feed, seen)
+
+        assert [item["guid"] for item in new_items] == ["guid-002"]
+        assert new_items[0]["title"] == "Second Article"
+        assert fingerprints == [item_fingerprint("guid-001"), item_fingerprint("guid-002")]
@@ -0,0 +1,115 @@
+"""Unit tests for poller URL fetching and content hashing."""
+
+from unittest.mock import patch
+
+
+class TestHashContent:
+    """Tests for content hashing."""
+
+    def test_hash_content(self):
+        """Test BLAKE2b-128 hashing."""
+        from fetch import hash_content
+
+        hash1 = hash_content("hello world")
+        hash2 = hash_content("hello world")
+        hash3 = hash_content("different content")
+
+        assert hash1 == hash2
+        assert hash1 != hash3
+        assert len(hash1) == 32  # BLAKE2b-128 hex length
+
+    def test_digest_body_hashes_all_chunks(self):
+        """Test that chunked bodies hash and measure as one body."""
+        from fetch import digest_body, hash_content
+
+        _, length, current_hash, legacy_hash = digest_body([b"con", b"tent"])
+
+        assert length == len(b"content")
+        assert current_hash == hash_content(b"content")
+        assert legacy_hash is None
+
+    def test_digest_body_head_counts_characters(self):
+        """Test that the head is cut by characters, not bytes."""
+        from fetch import digest_body
+
+        with patch("fetch.HTTP_TRIGGER_CONTENT_CHARS", 3):
+            head, length, _, _ = digest_body(["ééé".encode(), "éé".encode()])
+
+        assert head == "ééé"
+        assert length == 10
+
+    def test_digest_body_joins_split_characters(self):
+        """Test that a character split across chunks decodes whole."""
+        from fetch import digest_body
+
+        body = "café".encode()
+        head, _, _, _ = digest_body([body[:4], body[4:]])
+        assert head == "café"
+
+        # A character cut off at the end is dropped, not replaced
+        head, _, _, _ = digest_body([body[:4]])
+        assert head == "caf"
+
+
+class TestHttpChanged:
+    """Tests for http_changed function."""
+
+    def test_length_mismatch(self):
+        """Test that a different content length is reported as a change."""
+        from fetch import hash_content, http_changed
+
+        previous_hash = hash_content(b"abc")
+
+        assert http_changed(4, previous_hash, None, previous_hash, 3) is True
+
+
+class TestFetchUrl:
+    """Tests for fetch_url function."""
+
+    @patch("fetch.SESSION.get")
+    def test_fetch_url_streams_body(self, mock_get):
+        """Test that streamed chunks are joined into the body."""
+        from fetch import fetch_url
+
+        response = mock_get.return_value.__enter__.return_value
+        response.encoding = "utf-8"
+        response.iter_content.return_value = [b"<rss>", b"</rss>"]
+
+        assert fetch_url("https://example.com/feed.xml") == (b"<rss></rss>", "utf-8")
+        assert mock_get.call_args.kwargs["stream"] is True
+
+    @patch("fetch.MAX_BODY_BYTES", 8)
+    @patch("fetch.SESSION.get")
+    def test_fetch_url_caps_body_size(self, mock_get):
+        """Test that oversized bodies are truncated at MAX_BODY_BYTES."""
+        from fetch import fetch_url
+
+        response = mock_get.return_value.__enter__.return_value
+        response.encoding = "utf-8"
+        response.iter_content.return_value = iter([b"12345", b"67890", b"never-read"])
+
+        assert fetch_url("https://example.com/huge")[0] == b"12345678"
+
+    def test_retries_fit_lambda_timeout(self):
+        """Test that a hung origin fails before the 60s Lambda timeout."""
+        from fetch import REQUEST_TIMEOUT, SESSION
+
+        retry = SESSION.get_adapter("https://example.com").max_retries
+        connect_timeout, read_timeout = REQUEST_TIMEOUT
+
+        # Reads are never retried, so at most one read timeout is spent
+        assert retry.read == 0
+        assert connect_timeout * (retry.total + 1) + read_timeout < 60
+
+    @patch("fetch.SESSION.get")
+    def test_fetch_url_defaults_unknown_encoding(self, mock_get):
+        """Test that a missing or unknown charset falls back to UTF-8."""
+        from fetch import fetch_url
+
+        response = mock_get.return_value.__enter__.return_value
+        response.iter_content.return_value = [b"body"]
+
+        for encoding in (None, "x-not-a-charset"):
+            response.encoding = encoding
+            assert fetch_url("https://example.com") == (b"body", "utf-8")
+
@@ -1,175 +1,65 @@
 """Unit tests for poller Lambda handler."""
 
+import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+import requests
 
 
-class TestParseFeed:
-    """Tests for parse_feed function."""
 
-    def test_parse_rss_feed(self, sample_rss_feed):
-        """Test parsing standard RSS 2.0 feed."""
-        from handler import parse_feed
+class TestHttpChangeDetection:
+    """Tests for poll_http change detection against stored poll state."""
 
-        items = parse_feed(sample_rss_feed)
-
-        assert len(items) == 2
-        assert items[0]["title"] == "First Article"
-        assert items[0]["link"] == "https://example.com/article1"
-        assert items[0]["guid"] == "guid-001"
-        assert items[1]["guid"] == "guid-002"
-
-    def test_parse_atom_feed(self, sample_atom_feed):
-        """Test parsing Atom feed with id elements."""
-        from handler import parse_feed
-
-        items = parse_feed(sample_atom_feed)
-
-        assert len(items) == 2
-        assert items[0]["title"] == "Atom Article 1"
-        assert items[0]["link"] == "https://example.com/atom1"
-        assert items[0]["guid"] == "urn:uuid:atom-001"
-
-    def test_parse_atom_feed_fallback_link(self, sample_atom_feed_no_id):
-        """Test fallback to link when no id element."""
-        from handler import parse_feed
-
-        items = parse_feed(sample_atom_feed_no_id)
-
-        assert len(items) == 1
-        assert items[0]["guid"] == "https://example.com/no-id-article"
-
-    def test_parse_empty_feed(self):
-        """Test parsing empty feed."""
-        from handler import parse_feed
-
-        items = parse_feed("<rss><channel></channel></rss>")
-        assert items == []
-
-
-class TestFindNewItems:
-    """Tests for find_new_items function."""
-
-    def test_find_new_items(self):
-        """Test filtering to only new items."""
-        from handler import find_new_items
-
-        items = [
-            {"guid": "id1", "title": "Article 1"},
-            {"guid": "id2", "title": "Article 2"},
-            {"guid": "id3", "title": "Article 3"},
-        ]
-        seen_ids = ["id1", "id3"]
-
-        new_items = find_new_items(items, seen_ids)
-
-        assert len(new_items) == 1
-        assert new_items[0]["guid"] == "id2"
-
-    def test_find_new_items_all_new(self):
-        """Test when all items are new."""
-        from handler import find_new_items
-
-        items = [{"guid": "id1"}, {"guid": "id2"}]
-        seen_ids = []
-
-        new_items = find_new_items(items, seen_ids)
-
-        assert len(new_items) == 2
-
-    def test_find_new_items_none_new(self):
-        """Test when no items are new."""
-        from handler import find_new_items
-
-        items = [{"guid": "id1"}, {"guid": "id2"}]
-        seen_ids = ["id1", "id2", "id3"]
-
-        new_items = find_new_items(items, seen_ids)
-
-        assert len(new_items) == 0
-
-
-class TestPruneSeenIds:
-    """Tests for prune_seen_ids function."""
-
-    def test_prune_seen_ids_under_limit(self):
-        """Test pruning when under limit."""
-        from handler import prune_seen_ids
-
-        seen_ids = ["id1", "id2"]
-        new_ids = ["id3"]
-
-        result = prune_seen_ids(seen_ids, new_ids)
-
-        assert result == ["id1", "id2", "id3"]
-
-    def test_prune_seen_ids_over_limit(self):
-        """Test pruning when over limit."""
-        from handler import MAX_SEEN_ITEMS, prune_seen_ids
-
-        # Create list just under limit
-        seen_ids = [f"id{i}" for i in range(MAX_SEEN_ITEMS - 1)]
-        new_ids = ["new1", "new2", "new3"]
-
-        result = prune_seen_ids(seen_ids, new_ids)
-
-        assert len(result) == MAX_SEEN_ITEMS
-        # Should keep most recent (end of list)
-        assert result[-1] == "new3"
-        assert result[-2] == "new2"
-        assert result[-3] == "new1"
-
-
-class TestHashContent:
-    """Tests for hash_content function."""
+    def test_unchanged_body_not_triggered(self):
+        """Test that an identical body is not reported as changed."""
+        from handler import hash_content, poll_http
 
-    def test_hash_content(self):
-        """Test SHA256 hashing."""
-        from handler import hash_content
+        poll_state = {"last_content_hash": hash_content(b"same content")}
 
-        hash1 = hash_content("hello world")
-        hash2 = hash_content("hello world")
-        hash3 = hash_content("different content")
+        trigger_data, state_updates = poll_http("https://example.com", poll_state, b"same content")
 
-        assert hash1 == hash2
-        assert hash1 != hash3
-        assert len(hash1) == 64  # SHA256 hex length
+        assert trigger_data is None
+        assert state_updates["last_content_hash"] == poll_state["last_content_hash"]
 
+    def test_legacy_sha256_hash(self):
+        """Test that SHA-256 hashes from older state are still compared."""
+        import hashlib
 
-class TestCheckHttpChanged:
-    """Tests for check_http_changed function."""
+        from handler import hash_content, poll_http
 
-    def test_check_http_changed_first_poll(self):
-        """Test first poll (no previous hash)."""
-        from handler import check_http_changed
+        poll_state = {"last_content_hash": hashlib.sha256(b"same content").hexdigest()}
 
-        changed, new_hash = check_http_changed("content", None)
+        trigger_data, state_updates = poll_http("https://example.com", poll_state, b"same content")
+        assert trigger_data is None
+        assert state_updates["last_content_hash"] == hash_content(b"same content")
 
-        assert changed is True
-        assert len(new_hash) == 64
+        trigger_data, _ = poll_http("https://example.com", poll_state, b"other content")
+        assert trigger_data is not None
 
-    def test_check_http_changed_no_change(self):
-        """Test when content unchanged."""
-        from handler import check_http_changed, hash_content
+    def test_legacy_hash_of_latin1_decoded_text(self):
+        """Test that legacy hashes compare against the re-encoded response text."""
+        import hashlib
 
-        content = "same content"
-        previous_hash = hash_content(content)
+        from handler import poll_http
 
-        changed, new_hash = check_http_changed(content, previous_hash)
+        # requests decoded charset-less text/* bodies as ISO-8859-1
+        body = "café".encode()
+        stored_text = body.decode("iso-8859-1")
+        poll_state = {"last_content_hash": hashlib.sha256(stored_text.encode()).hexdigest()}
 
-        assert changed is False
-        assert new_hash == previous_hash
+        trigger_data, _ = poll_http("https://example.com", poll_state, body, "ISO-8859-1")
 
-    def test_check_http_changed_with_change(self):
-        """Test when content changed."""
-        from handler import check_http_changed
+        assert trigger_data is None
 
-        previous_hash = "old_hash_value_here_abcdef1234567890"
+    def test_same_length_compares_hash(self):
+        """Test that equal lengths fall through to the hash comparison."""
+        from handler import hash_content, poll_http
 
-        changed, new_hash = check_http_changed("new content", previous_hash)
+        poll_state = {"last_content_hash": hash_content(b"abc"), "last_content_length": 3}
 
-        assert changed is True
-        assert new_hash != previous_hash
+        assert poll_http("https://example.com", poll_state, b"abc")[0] is None
+        assert poll_http("https://example.com", poll_state, b"abd")[0] is not None
 
 
 class TestHandlerSkipConditions:
@@ -240,59 +130,214 @@ class TestHandlerSkipConditions:
         assert result["reason"] == "not_poll_trigger"
 
 
-class TestFailureHandling:
-    """Tests for failure handling."""
+class TestHandlerQueueing:
+    """Tests for how the handler queues executions."""
+
+    @patch("executions.handle_failure")
+    @patch("executions._sqs")
+    @patch("repository._ddb")
+    @patch("handler.get_poll_state")
+    @patch("handler.fetch_url")
+    @patch("handler.get_workflow")
+    def test_handler_unqueued_execution_not_reported_triggered(
+        self, mock_get_workflow, mock_fetch, mock_get_state, mock_ddb,
+        mock_sqs, mock_handle_failure, sample_workflow, sample_rss_feed, lambda_context,
+    ):
+        """Test that a failed send fails the poll and leaves seen items unsaved."""
+        from handler import handler
+
+        mock_get_workflow.return_value = sample_workflow
+        mock_fetch.return_value = (sample_rss_feed.encode(), "utf-8")
+        mock_get_state.return_value = {}
+        mock_sqs.return_value.send_message_batch.side_effect = RuntimeError("throttled")
+
+        result = handler({"workflow_id": "wf_test123"}, lambda_context)
+
+        assert result == {"status": "failed", "error": "throttled"}
+        mock_ddb.return_value.update_item.assert_not_called()
+        mock_handle_failure.assert_called_once()
+
+    @patch("handler.flush_executions")
+    @patch("handler.poll_workflows")
+    def test_handler_batches_multiple_workflows(
+        self, mock_poll_workflows, mock_flush, lambda_context
+    ):
+        """Test that a workflow_ids event polls all and flushes once."""
+        from handler import handler
+
+        mock_poll_workflows.return_value = {
+            "wf_a": {"status": "no_changes"},
+            "wf_b": {"status": "no_changes"},
+        }
+
+        result = handler(
+            {"workflow_ids": ["wf_a", "wf_b"], "time": "2025-12-21T10:00:00Z"},
+            lambda_context,
+        )
+
+        assert result["status"] == "batch"
+        assert set(result["results"]) == {"wf_a", "wf_b"}
+        mock_poll_workflows.assert_called_once()
+        mock_flush.assert_called_once()
+
+
+class TestPollWorkflows:
+    """Tests for multi-workflow polling."""
+
+    @patch("handler.update_poll_state")
+    @patch("handler.get_poll_state")
+    @patch("handler.fetch_url")
+    @patch("handler.get_workflow")
+    def test_poll_workflows_fetches_each_url(
+        self, mock_get_workflow, mock_fetch, mock_get_state, mock_update_state,
+        sample_workflow, sample_rss_feed,
+    ):
+        """Test that every pollable workflow is fetched and skips are kept."""
+        from handler import poll_workflows
+
+        mock_get_workflow.side_effect = lambda wf_id: (
+            None if wf_id == "wf_missing" else {**sample_workflow, "workflow_id": wf_id}
+        )
+        mock_fetch.return_value = (sample_rss_feed.encode(), "utf-8")
+        mock_get_state.return_value = {"seen_item_ids": ["guid-001", "guid-002"]}
+
+        results = poll_workflows(["wf_a", "wf_missing", "wf_b"], [])
+
+        assert list(results) == ["wf_a", "wf_missing", "wf_b"]
+        assert results["wf_missing"]["reason"] == "workflow_not_found"
+        assert results["wf_a"]["status"] == "no_changes"
+        assert results["wf_b"]["status"] == "no_changes"
+        assert mock_fetch.call_count == 2
 
-    @patch("handler.send_discord_notification")
-    @patch("handler.disable_eventbridge_rule")
-    @patch("handler.disable_workflow")
     @patch("handler.update_poll_state")
-    def test_handle_failure_increments_counter(
-        self, mock_update_state, mock_disable_wf, mock_disable_rule, mock_discord
+    @patch("handler.get_poll_state")
+    @patch("handler.fetch_url")
+    @patch("handler.get_workflow")
+    def test_unchanged_feed_reports_stored_item_count(
+        self, mock_get_workflow, mock_fetch, mock_get_state, mock_update_state,
+        sample_workflow, sample_rss_feed,
     ):
-        """Test that failure counter increments."""
-        from handler import handle_failure
+        """Test that skipping an unchanged feed still reports the seen items."""
+        from handler import hash_content, poll_workflows
+        from seen_items import item_fingerprint
+
+        content = sample_rss_feed.encode()
+        mock_get_workflow.return_value = sample_workflow
+        mock_fetch.return_value = (content, "utf-8")
+        mock_get_state.return_value = {
+            "seen_item_hashes": item_fingerprint("guid-001") + item_fingerprint("guid-002"),
+            "last_feed_hash": hash_content(content),
+        }
+
+        results = poll_workflows(["wf_a"], [])
+
+        assert results["wf_a"] == {"status": "no_changes", "items_checked": 2}
+
+    @patch("handler.handle_failure")
+    @patch("handler.get_poll_state")
+    @patch("handler.fetch_url")
+    @patch("handler.get_workflow")
+    def test_poll_workflows_fetch_error_is_isolated(
+        self, mock_get_workflow, mock_fetch, mock_get_state, mock_handle_failure,
+        sample_workflow,
+    ):
+        """Test that a failed fetch only fails its own workflow."""
+        from handler import poll_workflows
 
-        poll_state = {"consecutive_failures": 1}
+        mock_get_workflow.return_value = sample_workflow
+        mock_fetch.side_effect = requests.ConnectionError("boom")
+        mock_get_state.return_value = {}
 
-        handle_failure("wf_test", poll_state, "Connection error")
+        results = poll_workflows(["wf_a"], [])
 
-        mock_update_state.assert_called_once()
-        call_args = mock_update_state.call_args[0]
-        assert call_args[1]["consecutive_failures"] == 2
-        mock_disable_wf.assert_not_called()
+        assert results["wf_a"]["status"] == "failed"
+        mock_handle_failure.assert_called_once()
 
-    @patch("handler.send_discord_notification")
-    @patch("handler.disable_eventbridge_rule")
-    @patch("handler.disable_workflow")
     @patch("handler.update_poll_state")
-    def test_auto_disable_after_four_failures(
-        self, mock_update_state, mock_disable_wf, mock_disable_rule, mock_discord
+    @patch("handler.get_poll_state")
+    @patch("handler.fetch_url")
+    @patch("handler.get_workflow")
+    def test_poll_workflows_processes_fetches_as_they_complete(
+        self, mock_get_workflow, mock_fetch, mock_get_state, mock_update_state,
+        sample_workflow, sample_rss_feed,
+    ):
+        """Test that a fast fetch is processed before a slow earlier one."""
+        import threading
+
+        from handler import poll_workflows
+
+        slow_released = threading.Event()
+        processed = []
+
+        def fetch(url):
+            if url.endswith("slow"):
+                slow_released.wait(timeout=5)
+            return sample_rss_feed.encode(), "utf-8"
+
+        def get_state(workflow_id):
+            processed.append(workflow_id)
+            slow_released.set()
+            return {}
+
+        mock_get_workflow.side_effect = lambda wf_id: {
+            **sample_workflow,
+            "trigger": {"type": "poll", "config": {"url": f"https://example.com/{wf_id}"}},
+        }
+        mock_fetch.side_effect = fetch
+        mock_get_state.side_effect = get_state
+
+        results = poll_workflows(["slow", "fast"], [])
+
+        assert processed == ["fast", "slow"]
+        assert list(results) == ["slow", "fast"]
+
+
+class TestSnapStart:
+    """Tests for SnapStart initialization."""
+
+    @patch("handler.parse_feed")
+    @patch("repository._ddb")
+    def test_init_skipped_on_regular_cold_start(self, mock_ddb, mock_parse, monkeypatch):
+        """Test that clients stay lazy outside SnapStart init."""
+        from handler import init_snapstart
+
+        monkeypatch.delenv("AWS_LAMBDA_INITIALIZATION_TYPE", raising=False)
+
+        init_snapstart()
+
+        mock_ddb.assert_not_called()
+        mock_parse.assert_not_called()
+
+    @patch("handler.parse_feed")
+    @patch("failures._events")
+    @patch("executions._sqs")
+    @patch("repository._ddb")
+    def test_init_warms_clients_for_snapshot(
+        self, mock_ddb, mock_sqs, mock_events, mock_parse, monkeypatch
     ):
-        """Test auto-disable after 4 consecutive failures."""
-        from handler import handle_failure
+        """Test that clients and the feed parser are built during SnapStart init."""
+        from handler import init_snapstart
 
-        poll_state = {"consecutive_failures": 3}  # Will become 4
+        monkeypatch.setenv("AWS_LAMBDA_INITIALIZATION_TYPE", "snap-start")
 
-        handle_failure("wf_test", poll_state, "Connection error")
+        init_snapstart()
 
-        mock_disable_wf.assert_called_once_with("wf_test")
-        mock_disable_rule.assert_called_once_with("wf_test")
-        mock_discord.assert_called_once()
+        mock_ddb.assert_called_once()
+        mock_sqs.assert_called_once()
+        mock_events.assert_called_once()
+        mock_parse.assert_called_once()
 
-    @patch("handler.requests.post")
-    def test_send_discord_notification(self, mock_post):
-        """Test Discord notification sending."""
-        from handler import send_discord_notification
+    def test_refresh_clears_cached_clients(self):
+        """Test that restoring from a snapshot drops cached clients."""
+        import executions
+        import handler
 
-        mock_post.return_value = MagicMock(status_code=204)
+        executions._sqs()
+        assert executions._sqs.cache_info().currsize == 1
 
-        send_discord_notification("wf_test", "Test error", 4)
+        handler._refresh_clients()
 
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert "wf_test" in call_args[1]["json"]["content"]
-        assert "4" in call_args[1]["json"]["content"]
+        assert executions._sqs.cache_info().currsize == 0
 
 
 class TestPollFeed:
@@ -301,9 +346,10 @@ class TestPollFeed:
     @patch("handler.fetch_url")
     def test_poll_feed_with_new_items(self, mock_fetch, sample_rss_feed):
         """Test polling feed with new items."""
-        from handler import poll_feed
+        from handler import load_seen_fingerprints, poll_feed
+        from seen_items import item_fingerprint
 
-        mock_fetch.return_value = sample_rss_feed
+        mock_fetch.return_value = (sample_rss_feed.encode(), "utf-8")
         poll_state = {"seen_item_ids": ["guid-001"]}
 
         new_items, state_updates = poll_feed(
@@ -312,16 +358,35 @@ class TestPollFeed:
 
         assert len(new_items) == 1
         assert new_items[0]["guid"] == "guid-002"
-        assert "guid-001" in state_updates["seen_item_ids"]
-        assert "guid-002" in state_updates["seen_item_ids"]
+        seen = load_seen_fingerprints(state_updates)
+        assert item_fingerprint("guid-001") in seen
+        assert item_fingerprint("guid-002") in seen
         assert state_updates["consecutive_failures"] == 0
+        # Legacy GUID list is dropped after migration
+        assert state_updates["seen_item_ids"] is None
+
+    @patch("handler.fetch_url")
+    def test_poll_feed_with_packed_state(self, mock_fetch, sample_rss_feed):
+        """Test polling feed with fingerprint-based poll state."""
+        from handler import poll_feed
+        from seen_items import item_fingerprint
+
+        mock_fetch.return_value = (sample_rss_feed.encode(), "utf-8")
+        poll_state = {"seen_item_hashes": item_fingerprint("guid-001")}
+
+        new_items, state_updates = poll_feed(
+            "https://example.com/feed.xml", "rss", poll_state
+        )
+
+        assert [item["guid"] for item in new_items] == ["guid-002"]
+        assert "seen_item_ids" not in state_updates
 
     @patch("handler.fetch_url")
     def test_poll_feed_no_new_items(self, mock_fetch, sample_rss_feed):
         """Test polling feed with no new items."""
         from handler import poll_feed
 
-        mock_fetch.return_value = sample_rss_feed
+        mock_fetch.return_value = (sample_rss_feed.encode(), "utf-8")
         poll_state = {"seen_item_ids": ["guid-001", "guid-002"]}
 
         new_items, state_updates = poll_feed(
@@ -330,16 +395,37 @@ class TestPollFeed:
 
         assert len(new_items) == 0
 
+    @patch("handler.parse_new_feed_items")
+    @patch("handler.fetch_url")
+    def test_poll_feed_unchanged_skips_parse(self, mock_fetch, mock_parse, sample_rss_feed):
+        """Test that an unchanged feed body is not parsed again."""
+        from handler import hash_content, poll_feed
+
+        content = sample_rss_feed.encode()
+        mock_fetch.return_value = (content, "utf-8")
+        poll_state = {"seen_item_hashes": b"", "last_feed_hash": hash_content(content)}
+
+        new_items, state_updates = poll_feed(
+            "https://example.com/feed.xml", "rss", poll_state
+        )
+
+        assert new_items == []
+        mock_parse.assert_not_called()
+        assert "seen_item_hashes" not in state_updates
+        assert state_updates["consecutive_failures"] == 0
+
 
 class TestPollHttp:
     """Tests for poll_http function."""
 
-    @patch("handler.fetch_url")
-    def test_poll_http_first_check(self, mock_fetch):
+    @patch("fetch.SESSION.get")
+    def test_poll_http_first_check(self, mock_get):
         """Test first HTTP poll (no previous hash)."""
         from handler import poll_http
 
-        mock_fetch.return_value = "page content"
+        response = mock_get.return_value.__enter__.return_value
+        response.encoding = "utf-8"
+        response.iter_content.return_value = [b"page content"]
         poll_state = {}
 
         trigger_data, state_updates = poll_http("https://example.com", poll_state)
@@ -349,14 +435,16 @@ class TestPollHttp:
         assert state_updates["last_content_hash"] is not None
         assert state_updates["consecutive_failures"] == 0
 
-    @patch("handler.fetch_url")
-    def test_poll_http_content_changed(self, mock_fetch):
+    @patch("fetch.SESSION.get")
+    def test_poll_http_content_changed(self, mock_get):
         """Test HTTP poll when content changed."""
         from handler import hash_content, poll_http
 
         old_content = "old content"
         new_content = "new content"
-        mock_fetch.return_value = new_content
+        response = mock_get.return_value.__enter__.return_value
+        response.encoding = "utf-8"
+        response.iter_content.return_value = [new_content.encode()]
         poll_state = {"last_content_hash": hash_content(old_content)}
 
         trigger_data, state_updates = poll_http("https://example.com", poll_state)
@@ -366,15 +454,49 @@ class TestPollHttp:
         assert trigger_data["content_type"] == "http"
         assert "new content" in trigger_data["content"]
 
-    @patch("handler.fetch_url")
-    def test_poll_http_no_change(self, mock_fetch):
+    @patch("fetch.SESSION.get")
+    def test_poll_http_no_change(self, mock_get):
         """Test HTTP poll when content unchanged."""
         from handler import hash_content, poll_http
 
         content = "same content"
-        mock_fetch.return_value = content
+        response = mock_get.return_value.__enter__.return_value
+        response.encoding = "utf-8"
+        response.iter_content.return_value = [content.encode()]
         poll_state = {"last_content_hash": hash_content(content)}
 
         trigger_data, state_updates = poll_http("https://example.com", poll_state)
 
         assert trigger_data is None
+
+    @patch("fetch.HTTP_TRIGGER_CONTENT_CHARS", 4)
+    @patch("fetch.SESSION.get")
+    def test_poll_http_keeps_only_head(self, mock_get):
+        """Test that the body is hashed in full but only its head is kept."""
+        from handler import hash_content, poll_http
+
+        response = mock_get.return_value.__enter__.return_value
+        response.encoding = "utf-8"
+        response.iter_content.return_value = [b"new ", b"page body"]
+        poll_state = {"last_content_hash": hash_content(b"old page body")}
+
+        trigger_data, state_updates = poll_http("https://example.com", poll_state)
+
+        assert trigger_data["content"] == "new "
+        assert trigger_data["content_hash"] == hash_content(b"new page body")
+        assert state_updates["last_content_length"] == len(b"new page body")
+
+    @patch("fetch.SESSION.get")
+    def test_poll_http_decodes_with_response_charset(self, mock_get):
+        """Test that trigger content is decoded with the declared charset."""
+        from handler import hash_content, poll_http
+
+        response = mock_get.return_value.__enter__.return_value
+        response.encoding = "windows-1252"
+        response.iter_content.return_value = ["café".encode("cp1252")]
+        poll_state = {"last_content_hash": hash_content(b"old")}
+
+        trigger_data, _ = poll_http("https://example.com", poll_state)
+
+        assert trigger_data["content"] == "café"
+
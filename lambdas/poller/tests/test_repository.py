@@ -0,0 +1,55 @@
+"""Unit tests for poller DynamoDB access."""
+
+from unittest.mock import patch
+
+
+class TestDynamoDbOperations:
+    """Tests for low-level DynamoDB access."""
+
+    @patch("repository._ddb")
+    def test_get_workflow_deserializes_item(self, mock_ddb):
+        """Test that typed attributes are converted to Python values."""
+        from repository import get_workflow
+
+        mock_ddb.return_value.get_item.return_value = {
+            "Item": {
+                "workflow_id": {"S": "wf_test"},
+                "enabled": {"BOOL": True},
+                "trigger": {"M": {"type": {"S": "poll"}}},
+            }
+        }
+
+        workflow = get_workflow("wf_test")
+
+        assert workflow == {
+            "workflow_id": "wf_test",
+            "enabled": True,
+            "trigger": {"type": "poll"},
+        }
+        call_kwargs = mock_ddb.return_value.get_item.call_args.kwargs
+        assert call_kwargs["Key"] == {"workflow_id": {"S": "wf_test"}}
+
+    @patch("repository._ddb")
+    def test_get_poll_state_missing(self, mock_ddb):
+        """Test that missing poll state returns an empty dict."""
+        from repository import get_poll_state
+
+        mock_ddb.return_value.get_item.return_value = {}
+
+        assert get_poll_state("wf_test") == {}
+
+    @patch("repository._ddb")
+    def test_update_poll_state_serializes_values(self, mock_ddb):
+        """Test that update values are sent as typed attributes."""
+        from repository import update_poll_state
+
+        update_poll_state(
+            "wf_test",
+            {"consecutive_failures": 2, "last_error": None, "seen_item_hashes": b"\x01"},
+        )
+
+        call_kwargs = mock_ddb.return_value.update_item.call_args.kwargs
+        values = call_kwargs["ExpressionAttributeValues"]
+        assert values[":consecutive_failures"] == {"N": "2"}
+        assert values[":last_error"] == {"NULL": True}
+        assert values[":seen_item_hashes"] == {"B": b"\x01"}
@@ -0,0 +1,77 @@
+"""Unit tests for poller seen-item tracking."""
+
+
+class TestSeenFingerprints:
+    """Tests for seen-item fingerprint storage."""
+
+    def test_fingerprint_is_compact_and_stable(self):
+        """Test fingerprints are fixed-size and deterministic."""
+        from seen_items import SEEN_FINGERPRINT_BYTES, item_fingerprint
+
+        assert len(item_fingerprint("https://example.com/a")) == SEEN_FINGERPRINT_BYTES
+        assert item_fingerprint("guid-001") == item_fingerprint("guid-001")
+        assert item_fingerprint("guid-001") != item_fingerprint("guid-002")
+
+    def test_load_packed_fingerprints(self):
+        """Test unpacking the binary attribute as returned by boto3."""
+        from boto3.dynamodb.types import Binary
+
+        from seen_items import item_fingerprint, load_seen_fingerprints
+
+        fingerprints = [item_fingerprint("a"), item_fingerprint("b")]
+        poll_state = {"seen_item_hashes": Binary(b"".join(fingerprints))}
+
+        assert load_seen_fingerprints(poll_state) == fingerprints
+
+    def test_load_legacy_seen_ids(self):
+        """Test fallback to the legacy GUID list."""
+        from seen_items import item_fingerprint, load_seen_fingerprints
+
+        poll_state = {"seen_item_ids": ["a", "b"]}
+
+        assert load_seen_fingerprints(poll_state) == [
+            item_fingerprint("a"),
+            item_fingerprint("b"),
+        ]
+        assert load_seen_fingerprints({}) == []
+
+
+class TestPruneSeenIds:
+    """Tests for prune_seen_ids function."""
+
+    def test_prune_seen_ids_under_limit(self):
+        """Test pruning when under limit."""
+        from seen_items import prune_seen_ids
+
+        seen_ids = ["id1", "id2"]
+        new_ids = ["id3"]
+
+        result = prune_seen_ids(seen_ids, new_ids)
+
+        assert result == ["id1", "id2", "id3"]
+
+    def test_prune_seen_ids_over_limit(self):
+        """Test pruning when over limit."""
+        from seen_items import MAX_SEEN_ITEMS, prune_seen_ids
+
+        # Create list just under limit
+        seen_ids = [f"id{i}" for i in range(MAX_SEEN_ITEMS - 1)]
+        new_ids = ["new1", "new2", "new3"]
+
+        result = prune_seen_ids(seen_ids, new_ids)
+
+        assert len(result) == MAX_SEEN_ITEMS
+        # Should keep most recent (end of list)
+        assert result[-1] == "new3"
+        assert result[-2] == "new2"
+        assert result[-3] == "new1"
+
+    def test_prune_seen_ids_more_new_than_limit(self):
+        """Test that only the newest MAX_SEEN_ITEMS IDs survive a large batch."""
+        from seen_items import MAX_SEEN_ITEMS, prune_seen_ids
+
+        new_ids = [f"new{i}" for i in range(MAX_SEEN_ITEMS + 5)]
+
+        result = prune_seen_ids(["old1"], new_ids)
+
+        assert result == new_ids[-MAX_SEEN_ITEMS:]
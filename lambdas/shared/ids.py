@@ -5,31 +5,46 @@ Uses ULID for time-sortable, unique identifiers.
 
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
+import os
+import time
+
+SECONDS_PER_DAY = 86400
+
+# Crockford base32, lowercase so new IDs sort after the older hex-based ones
+ULID_ALPHABET = "0123456789abcdefghjkmnpqrstvwxyz"
+
+
+def generate_ulid() -> str:
+    """Generate a ULID: 48-bit millisecond timestamp plus 80 random bits.
+
+    Returns:
+        26-character lowercase Crockford base32 string
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms << 80) | int.from_bytes(os.urandom(10), "big")
+
+    chars = [""] * 26
+    for i in range(25, -1, -1):
+        chars[i] = ULID_ALPHABET[value & 31]
+        value >>= 5
+    return "".join(chars)
 
 
 def generate_execution_id() -> str:
     """Generate a time-sortable execution ID.
 
-    Format: ex_{timestamp_hex}_{random_hex}
+    Format: ex_{ulid}
 
     This provides:
-    - Time-based sorting (newer IDs sort after older ones)
+    - Time-based sorting (newer IDs sort after older ones, including the
+      earlier ex_{timestamp_hex}_{random_hex} format)
     - Uniqueness across concurrent executions
     - Readable prefix for debugging
 
     Returns:
-        Execution ID like "ex_018c8f3a1b2c_a1b2c3d4e5f6"
+        Execution ID like "ex_01jfzq8r9m3v6n2k7x4c5b8t0w"
     """
-    # Get current timestamp in milliseconds
-    timestamp_ms = int(datetime.utcnow().timestamp() * 1000)
-    timestamp_hex = format(timestamp_ms, "012x")
-
-    # Random component for uniqueness
-    random_hex = uuid.uuid4().hex[:12]
-
-    return f"ex_{timestamp_hex}_{random_hex}"
+    return "ex_" + generate_ulid()
 
 
 def get_current_timestamp() -> str:
@@ -38,7 +53,8 @@ def get_current_timestamp() -> str:
     Returns:
         ISO 8601 formatted timestamp like "2025-01-15T10:30:00Z"
     """
-    return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    now = time.gmtime()
+    return "%04d-%02d-%02dT%02d:%02d:%02dZ" % now[:6]
 
 
 def calculate_ttl_timestamp(days: int = 90) -> int:
@@ -50,7 +66,4 @@ def calculate_ttl_timestamp(days: int = 90) -> int:
     Returns:
         Unix timestamp for TTL attribute
     """
-    from datetime import timedelta
-
-    expiry = datetime.utcnow() + timedelta(days=days)
-    return int(expiry.timestamp())
+    return int(time.time()) + days * SECONDS_PER_DAY
@@ -6,8 +6,10 @@ Supports nested paths, array indexing, and filters.
 
 from __future__ import annotations
 
+import json
 import re
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
 
 class InterpolationError(Exception):
@@ -22,16 +24,53 @@ class InterpolationError(Exception):
 # Pattern to match {{variable}} or {{variable | filter}}
 VARIABLE_PATTERN = re.compile(r"\{\{\s*([^}|]+?)(?:\s*\|\s*([^}]+?))?\s*\}\}")
 
-# Pattern for array indexing like items[0]
-ARRAY_INDEX_PATTERN = re.compile(r"^(.+?)\[(\d+)\]$")
+# Pattern for the default filter argument like default('N/A')
+DEFAULT_FILTER_PATTERN = re.compile(r"default\(['\"](.+?)['\"]\)")
 
+FilterFunc = Callable[[Any, str], Any]
+PathSteps = tuple[tuple[str, int | None], ...]
+CompiledTemplate = tuple[str | tuple[str, PathSteps, FilterFunc | None], ...]
 
-def _resolve_path(context: dict, path: str) -> Any:
+# Bound once; stdlib rather than orjson so rendered output keeps its
+# ", " / ": " separators and the same error behaviour
+_json_dumps = json.dumps
+
+# Sentinel for absent keys, so a dict step costs one lookup (None is a
+# valid value and must still resolve)
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _parse_path(path: str) -> PathSteps:
+    """Split a dot-separated path into (key, index) steps.
+
+    Parsed once per distinct path so resolution needs no string splitting.
+    A part ending in "[digits]" with a non-empty key before it is an index
+    step; anything else is a plain key.
+
+    Args:
+        path: Dot-separated path like "trigger.items[0].name"
+
+    Returns:
+        Tuple of (key, index) pairs, index None for plain key access
+    """
+    steps = []
+    for part in path.strip().split("."):
+        key, bracket, index = part.rpartition("[")
+        if key and bracket and index[-1:] == "]" and index[:-1].isdecimal():
+            steps.append((key, int(index[:-1])))
+        else:
+            steps.append((part, None))
+    return tuple(steps)
+
+
+def _resolve_path(context: dict, path: str, steps: PathSteps | None = None) -> Any:
     """Resolve a dot-separated path to a value in context.
 
     Args:
         context: The context dictionary to search in
         path: Dot-separated path like "trigger.items[0].name"
+        steps: Pre-parsed steps for ``path``, parsed here if omitted
 
     Returns:
         The value at the path
@@ -39,24 +78,22 @@ def _resolve_path(context: dict, path: str) -> Any:
     Raises:
         InterpolationError: If path cannot be resolved
     """
-    parts = path.strip().split(".")
+    if steps is None:
+        steps = _parse_path(path)
+
     current = context
 
-    for part in parts:
+    for key, index in steps:
         if current is None:
+            part = key if index is None else f"{key}[{index}]"
             raise InterpolationError(path, f"Cannot access '{part}' on None")
 
-        # Check for array indexing
-        array_match = ARRAY_INDEX_PATTERN.match(part)
-        if array_match:
-            key, index = array_match.groups()
-            index = int(index)
-
+        if index is not None:
             # Get the array
             if isinstance(current, dict):
-                if key not in current:
+                current = current.get(key, _MISSING)
+                if current is _MISSING:
                     raise InterpolationError(path, f"Key '{key}' not found")
-                current = current[key]
             else:
                 raise InterpolationError(
                     path, f"Expected dict to access '{key}', got {type(current).__name__}"
@@ -75,23 +112,57 @@ def _resolve_path(context: dict, path: str) -> Any:
         else:
             # Regular key access
             if isinstance(current, dict):
-                if part not in current:
-                    raise InterpolationError(path, f"Key '{part}' not found")
-                current = current[part]
+                current = current.get(key, _MISSING)
+                if current is _MISSING:
+                    raise InterpolationError(path, f"Key '{key}' not found")
             elif isinstance(current, (list, tuple)):
                 raise InterpolationError(
-                    path, f"Cannot access key '{part}' on list"
+                    path, f"Cannot access key '{key}' on list"
                 )
             else:
                 raise InterpolationError(
-                    path, f"Cannot access '{part}' on {type(current).__name__}"
+                    path, f"Cannot access '{key}' on {type(current).__name__}"
                 )
 
     return current
 
 
-def _apply_filter(value: Any, filter_expr: str, path: str) -> Any:
-    """Apply a filter to a value.
+def _filter_upper(value: Any, path: str) -> str:
+    """Convert to uppercase."""
+    if not isinstance(value, str):
+        raise InterpolationError(path, f"Filter 'upper' requires string, got {type(value).__name__}")
+    return value.upper()
+
+
+def _filter_lower(value: Any, path: str) -> str:
+    """Convert to lowercase."""
+    if not isinstance(value, str):
+        raise InterpolationError(path, f"Filter 'lower' requires string, got {type(value).__name__}")
+    return value.lower()
+
+
+def _filter_string(value: Any, path: str) -> str:
+    """Convert to string."""
+    return str(value) if value is not None else ""
+
+
+def _filter_json(value: Any, path: str) -> Any:
+    """Keep as-is (for JSON serialization)."""
+    return value
+
+
+# Filters that take no argument, by name
+_FILTERS: dict[str, FilterFunc] = {
+    "upper": _filter_upper,
+    "lower": _filter_lower,
+    "string": _filter_string,
+    "json": _filter_json,
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_filter(filter_expr: str) -> FilterFunc:
+    """Turn a filter expression into a function of (value, path).
 
     Supported filters:
     - upper: Convert to uppercase
@@ -101,82 +172,193 @@ def _apply_filter(value: Any, filter_expr: str, path: str) -> Any:
     - json: Keep as-is (for JSON serialization)
 
     Args:
-        value: The value to filter
         filter_expr: Filter expression like "upper" or "default('N/A')"
-        path: Original path for error messages
 
     Returns:
-        Filtered value
-
-    Raises:
-        InterpolationError: If filter is unknown or fails
+        Function applying the filter. For unknown filters it raises
+        InterpolationError when called, so the error surfaces at render time.
     """
     filter_name = filter_expr.strip()
 
     # Check for default filter with argument
-    default_match = re.match(r"default\(['\"](.+?)['\"]\)", filter_name)
+    default_match = DEFAULT_FILTER_PATTERN.match(filter_name)
     if default_match:
         default_value = default_match.group(1)
-        return default_value if value is None else value
+        return lambda value, path: default_value if value is None else value
 
-    # Simple filters
-    if filter_name == "upper":
-        if not isinstance(value, str):
-            raise InterpolationError(path, f"Filter 'upper' requires string, got {type(value).__name__}")
-        return value.upper()
+    filter_func = _FILTERS.get(filter_name)
+    if filter_func is not None:
+        return filter_func
 
-    if filter_name == "lower":
-        if not isinstance(value, str):
-            raise InterpolationError(path, f"Filter 'lower' requires string, got {type(value).__name__}")
-        return value.lower()
+    def unknown_filter(value: Any, path: str) -> Any:
+        raise InterpolationError(path, f"Unknown filter: {filter_name}")
 
-    if filter_name == "string":
-        return str(value) if value is not None else ""
+    return unknown_filter
 
-    if filter_name == "json":
-        return value
-
-    raise InterpolationError(path, f"Unknown filter: {filter_name}")
 
+@lru_cache(maxsize=2048)
+def _compile_template(template: str) -> CompiledTemplate:
+    """Compile a string template into literal text and placeholders.
 
-def _interpolate_string(template: str, context: dict) -> str:
-    """Interpolate variables in a string template.
+    Each placeholder carries its parsed path steps and compiled filter, so a
+    cached template renders without any further parsing or cache lookups.
 
     Args:
         template: String with {{variable}} placeholders
+
+    Returns:
+        Tuple of literal strings and (path, steps, filter function) triples
+        in order
+    """
+    segments: list[str | tuple[str, PathSteps, FilterFunc | None]] = []
+    position = 0
+    for match in VARIABLE_PATTERN.finditer(template):
+        if match.start() > position:
+            segments.append(template[position:match.start()])
+        path = match.group(1)
+        filter_expr = match.group(2)
+        segments.append((
+            path,
+            _parse_path(path),
+            _compile_filter(filter_expr) if filter_expr else None,
+        ))
+        position = match.end()
+    if position < len(template):
+        segments.append(template[position:])
+    return tuple(segments)
+
+
+def _render_placeholder(
+    path: str, steps: PathSteps, filter_func: FilterFunc | None, context: dict
+) -> str:
+    """Resolve one placeholder and convert it to its string form.
+
+    Args:
+        path: Dot-separated path to resolve
+        steps: Parsed steps for ``path``
+        filter_func: Compiled filter, or None
         context: Context dictionary with values
 
     Returns:
-        String with placeholders replaced
+        String to substitute for the placeholder
 
     Raises:
-        InterpolationError: If any variable cannot be resolved
+        InterpolationError: If the path cannot be resolved or the filter fails
     """
+    # Resolve the path
+    value = _resolve_path(context, path, steps)
 
-    def replace_match(match: re.Match) -> str:
-        path = match.group(1)
-        filter_expr = match.group(2)
+    # Apply filter if present
+    if filter_func is not None:
+        value = filter_func(value, path)
 
-        # Resolve the path
-        value = _resolve_path(context, path)
+    # Convert to string for interpolation
+    if type(value) is str:
+        # Most placeholders resolve to plain strings; skip the type checks
+        return value
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (dict, list)):
+        # For complex types in string context, use JSON
+        return _json_dumps(value)
+    return str(value)
 
-        # Apply filter if present
-        if filter_expr:
-            value = _apply_filter(value, filter_expr, path)
 
-        # Convert to string for interpolation
-        if value is None:
-            return ""
-        if isinstance(value, bool):
-            return str(value).lower()
-        if isinstance(value, (dict, list)):
-            # For complex types in string context, use repr
-            import json
+def _render(segments: CompiledTemplate, context: dict) -> str:
+    """Render a compiled template against a context.
 
-            return json.dumps(value)
-        return str(value)
+    Args:
+        segments: Output of _compile_template
+        context: Context dictionary with values
 
-    return VARIABLE_PATTERN.sub(replace_match, template)
+    Returns:
+        Rendered string
+
+    Raises:
+        InterpolationError: If any variable cannot be resolved
+    """
+    count = len(segments)
+    if count == 1:
+        # Whole string is one placeholder (or a literal with a stray "{{")
+        segment = segments[0]
+        if isinstance(segment, str):
+            return segment
+        return _render_placeholder(*segment, context)
+
+    if count == 2:
+        # One placeholder with a literal prefix or suffix (or two placeholders);
+        # a plain concatenation is cheaper than building a list to join
+        first, second = segments
+        if not isinstance(first, str):
+            first = _render_placeholder(*first, context)
+        if not isinstance(second, str):
+            second = _render_placeholder(*second, context)
+        return first + second
+
+    return "".join([
+        segment if isinstance(segment, str) else _render_placeholder(*segment, context)
+        for segment in segments
+    ])
+
+
+def _interpolate_value(template: Any, context: dict) -> Any:
+    """Recursively interpolate a template, copying only what changes.
+
+    Dicts and lists are copied on the first changed child; subtrees with no
+    placeholders come back as the same object.
+
+    Args:
+        template: String, dict, list, or other value
+        context: Context dictionary with values
+
+    Returns:
+        Template with all placeholders replaced
+    """
+    if isinstance(template, str):
+        if "{{" not in template:
+            # No placeholders; also keeps static strings out of the compile cache
+            return template
+        return _render(_compile_template(template), context)
+
+    if isinstance(template, dict):
+        result = None
+        for key, value in template.items():
+            # Leaves are handled inline; only containers recurse
+            if isinstance(value, str):
+                if "{{" not in value:
+                    continue
+                new_value = _render(_compile_template(value), context)
+            elif isinstance(value, (dict, list)):
+                new_value = _interpolate_value(value, context)
+            else:
+                continue
+            if new_value is not value:
+                if result is None:
+                    result = dict(template)
+                result[key] = new_value
+        return template if result is None else result
+
+    if isinstance(template, list):
+        result = None
+        for index, item in enumerate(template):
+            if isinstance(item, str):
+                if "{{" not in item:
+                    continue
+                new_item = _render(_compile_template(item), context)
+            elif isinstance(item, (dict, list)):
+                new_item = _interpolate_value(item, context)
+            else:
+                continue
+            if new_item is not item:
+                if result is None:
+                    result = list(template)
+                result[index] = new_item
+        return template if result is None else result
+
+    # For other types (int, float, bool, None), return as-is
+    return template
 
 
 def interpolate(template: str | dict | list, context: dict) -> str | dict | list:
@@ -200,22 +382,12 @@ def interpolate(template: str | dict | list, context: dict) -> str | dict | list
             }
 
     Returns:
-        Template with all placeholders replaced
+        Template with all placeholders replaced. Dicts and lists are only
+        copied along paths that contain placeholders; unchanged subtrees
+        (or the whole template) are returned as the same objects, so treat
+        the result as read-only.
 
     Raises:
         InterpolationError: If any variable path cannot be resolved
     """
-    if isinstance(template, str):
-        return _interpolate_string(template, context)
-
-    if isinstance(template, dict):
-        return {
-            key: interpolate(value, context)
-            for key, value in template.items()
-        }
-
-    if isinstance(template, list):
-        return [interpolate(item, context) for item in template]
-
-    # For other types (int, float, bool, None), return as-is
-    return template
+    return _interpolate_value(template, context)
@@ -4,8 +4,10 @@ import time
 from datetime import datetime, timedelta
 
 from shared.ids import (
+    ULID_ALPHABET,
     calculate_ttl_timestamp,
     generate_execution_id,
+    generate_ulid,
     get_current_timestamp,
 )
 
@@ -22,12 +24,10 @@ class TestGenerateExecutionId:
         """Test execution ID format."""
         execution_id = generate_execution_id()
         parts = execution_id.split("_")
-        assert len(parts) == 3
+        assert len(parts) == 2
         assert parts[0] == "ex"
-        # Timestamp hex is 12 chars
-        assert len(parts[1]) == 12
-        # Random hex is 12 chars
-        assert len(parts[2]) == 12
+        # ULID is 26 chars
+        assert len(parts[1]) == 26
 
     def test_uniqueness(self):
         """Test that generated IDs are unique."""
@@ -42,14 +42,27 @@ class TestGenerateExecutionId:
         # Later ID should sort after earlier one
         assert id2 > id1
 
-    def test_all_hex_chars(self):
-        """Test that ID parts contain only valid hex characters."""
+    def test_crockford_chars(self):
+        """Test that the ULID uses only lowercase Crockford base32 characters."""
         execution_id = generate_execution_id()
-        parts = execution_id.split("_")
-        # Validate timestamp part is hex
-        int(parts[1], 16)  # Will raise if not valid hex
-        # Validate random part is hex
-        int(parts[2], 16)  # Will raise if not valid hex
+        assert set(execution_id[3:]) <= set(ULID_ALPHABET)
+
+    def test_timestamp_prefix(self):
+        """Test that the ULID's first 10 chars encode the current time in ms."""
+        before = time.time_ns() // 1_000_000
+        ulid = generate_ulid()
+        after = time.time_ns() // 1_000_000
+
+        timestamp_ms = 0
+        for char in ulid[:10]:
+            timestamp_ms = timestamp_ms * 32 + ULID_ALPHABET.index(char)
+        assert before <= timestamp_ms <= after
+
+    def test_sorts_after_legacy_hex_ids(self):
+        """Test that new IDs sort after IDs in the earlier hex format."""
+        timestamp_hex = format(time.time_ns() // 1_000_000, "012x")
+        legacy_id = f"ex_{timestamp_hex}_ffffffffffff"
+        assert generate_execution_id() > legacy_id
 
 
 class TestGetCurrentTimestamp:
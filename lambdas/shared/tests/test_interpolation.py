@@ -56,35 +56,26 @@ class TestBasicInterpolation:
 class TestFilters:
     """Test interpolation filters."""
 
-    def test_upper_filter(self):
-        """Test upper filter."""
-        template = "{{name | upper}}"
-        context = {"name": "hello"}
-        assert interpolate(template, context) == "HELLO"
-
-    def test_lower_filter(self):
-        """Test lower filter."""
-        template = "{{name | lower}}"
-        context = {"name": "HELLO"}
-        assert interpolate(template, context) == "hello"
-
-    def test_default_filter(self):
-        """Test default filter with None value."""
-        template = "{{value | default('fallback')}}"
-        context = {"value": None}
-        assert interpolate(template, context) == "fallback"
-
-    def test_default_filter_with_existing_value(self):
-        """Test default filter doesn't override existing value."""
-        template = "{{name | default('fallback')}}"
-        context = {"name": "present"}
-        assert interpolate(template, context) == "present"
-
-    def test_string_filter(self):
-        """Test string filter on number."""
-        template = "Count: {{count | string}}"
-        context = {"count": 42}
-        assert interpolate(template, context) == "Count: 42"
+    @pytest.mark.parametrize(
+        ("template", "context", "expected"),
+        [
+            pytest.param("{{name | upper}}", {"name": "hello"}, "HELLO", id="upper"),
+            pytest.param("{{name | lower}}", {"name": "HELLO"}, "hello", id="lower"),
+            pytest.param(
+                "{{value | default('fallback')}}", {"value": None}, "fallback", id="default"
+            ),
+            pytest.param(
+                "{{name | default('fallback')}}",
+                {"name": "present"},
+                "present",
+                id="default-existing-value",
+            ),
+            pytest.param("Count: {{count | string}}", {"count": 42}, "Count: 42", id="string"),
+        ],
+    )
+    def test_filter(self, template, context, expected):
+        """Test each filter, one case per filter so a failure names it."""
+        assert interpolate(template, context) == expected
 
     def test_json_filter(self):
         """Test json filter."""
@@ -151,6 +142,27 @@ class TestRecursiveInterpolation:
         result = interpolate(template, context)
         assert result == template
 
+    def test_static_structure_returned_as_is(self):
+        """Test that a structure without placeholders is not copied."""
+        template = {"headers": {"Accept": "application/json"}, "tags": ["a", 1]}
+        assert interpolate(template, {}) is template
+
+    def test_unchanged_subtrees_are_shared(self):
+        """Test that only the path to a placeholder is copied."""
+        template = {
+            "static": {"Accept": "application/json"},
+            "body": {"title": "{{title}}", "tags": ["a", "b"]},
+        }
+        result = interpolate(template, {"title": "Hi"})
+
+        assert result == {
+            "static": {"Accept": "application/json"},
+            "body": {"title": "Hi", "tags": ["a", "b"]},
+        }
+        assert result["static"] is template["static"]
+        assert result["body"]["tags"] is template["body"]["tags"]
+        assert template["body"]["title"] == "{{title}}"
+
 
 class TestErrorHandling:
     """Test error handling."""
@@ -177,6 +189,16 @@ class TestErrorHandling:
         with pytest.raises(InterpolationError):
             interpolate(template, context)
 
+    def test_unknown_filter(self):
+        """Test that an unknown filter raises InterpolationError."""
+        with pytest.raises(InterpolationError, match="Unknown filter: reverse"):
+            interpolate("{{name | reverse}}", {"name": "abc"})
+
+    def test_upper_filter_on_non_string(self):
+        """Test that upper on a non-string raises InterpolationError."""
+        with pytest.raises(InterpolationError, match="requires string"):
+            interpolate("{{count | upper}}", {"count": 3})
+
 
 class TestEdgeCases:
     """Test edge cases."""
@@ -214,3 +236,27 @@ class TestEdgeCases:
         template = "User {{user.id}} is {{status}}"
         context = {"user": {"id": 123}, "status": "active"}
         assert interpolate(template, context) == "User 123 is active"
+
+    def test_adjacent_and_repeated_placeholders(self):
+        """Test placeholders with no literal text between them, used twice."""
+        template = "{{a}}{{b}}-{{a}}"
+        context = {"a": "x", "b": "y"}
+        assert interpolate(template, context) == "xy-x"
+
+    def test_placeholder_with_suffix_or_pair(self):
+        """Test two-segment templates: placeholder plus suffix, and two placeholders."""
+        context = {"a": "x", "b": 2}
+        assert interpolate("{{a}}!", context) == "x!"
+        assert interpolate("{{a}}{{b}}", context) == "x2"
+
+    def test_substituted_values_are_not_reinterpolated(self):
+        """Test that a value containing placeholder syntax is inserted verbatim."""
+        template = "{{first}} {{second}}"
+        context = {"first": "{{second}}", "second": "b"}
+        assert interpolate(template, context) == "{{second}} b"
+
+    def test_cached_template_resolves_against_each_context(self):
+        """Test that a reused template picks up values from the current context."""
+        template = "Item: {{items[1].name}}"
+        assert interpolate(template, {"items": [{"name": "a"}, {"name": "b"}]}) == "Item: b"
+        assert interpolate(template, {"items": [{"name": "c"}, {"name": "d"}]}) == "Item: d"
@@ -6,16 +6,25 @@ Handles JSON, form-urlencoded, and raw body types.
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+from collections.abc import Mapping
 from datetime import datetime, timezone
+from time import monotonic, time_ns
 from typing import TYPE_CHECKING, Any
-from urllib.parse import parse_qs
+from urllib.parse import parse_qsl
 
 import boto3
+import orjson
 from aws_lambda_powertools import Logger, Tracer
-from aws_lambda_powertools.event_handler import APIGatewayHttpResolver
-from aws_lambda_powertools.event_handler.exceptions import BadRequestError, NotFoundError
+from aws_lambda_powertools.event_handler.exceptions import (
+    BadRequestError,
+    NotFoundError,
+    ServiceError,
+)
+from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEventV2
+from botocore.config import Config
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
@@ -27,18 +36,34 @@ if TYPE_CHECKING:
 
 logger = Logger(service="webhook-receiver")
 tracer = Tracer(service="webhook-receiver")
-app = APIGatewayHttpResolver()
 
-# AWS clients
-dynamodb = boto3.resource("dynamodb")
-sqs_client = boto3.client("sqs")
+# AWS clients are built on first use (_workflows_table, _sqs); keepalive holds
+# the warm connection open between invocations
+_CLIENT_CONFIG = Config(retries={"mode": "standard"}, tcp_keepalive=True)
 
 # Environment variables
 WORKFLOWS_TABLE_NAME = os.environ.get("WORKFLOWS_TABLE_NAME", "dev-Workflows")
 EXECUTION_QUEUE_URL = os.environ.get("EXECUTION_QUEUE_URL", "")
 
+# Workflow cache; edits and disables reach warm containers within the TTL
+_workflow_cache: dict[str, tuple[float, dict]] = {}
+WORKFLOW_CACHE_TTL = int(os.environ.get("WORKFLOW_CACHE_TTL", "30"))  # seconds
+
+_UTC = timezone.utc
+
+# Form bodies with more fields than this are stored raw instead of parsed
+MAX_FORM_FIELDS = 1000
+
+# Crockford base32 for execution IDs, lowercase to match shared.ids
+ULID_ALPHABET = "0123456789abcdefghjkmnpqrstvwxyz"
+
+# Shared JSON codecs. The fallback encoder escapes non-ASCII so lone
+# surrogates, which orjson rejects, still produce a UTF-8-encodable body.
+_JSON_DECODER = json.JSONDecoder()
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
 # Headers to exclude from trigger data (AWS-specific)
-EXCLUDED_HEADERS = {
+EXCLUDED_HEADERS = frozenset({
     "x-amzn-trace-id",
     "x-forwarded-for",
     "x-forwarded-port",
@@ -49,7 +74,22 @@ EXCLUDED_HEADERS = {
     "host",
     "connection",
     "content-length",
-}
+})
+
+# Header name prefixes added by API Gateway / CloudFront, also excluded
+EXCLUDED_HEADER_PREFIXES = ("x-amzn-", "x-forwarded-", "cloudfront-")
+
+
+@functools.cache
+def _workflows_table():
+    """Get the Workflows table resource, built once per container."""
+    return boto3.resource("dynamodb", config=_CLIENT_CONFIG).Table(WORKFLOWS_TABLE_NAME)
+
+
+@functools.cache
+def _sqs():
+    """Get the SQS client."""
+    return boto3.client("sqs", config=_CLIENT_CONFIG)
 
 
 class WebhookResponse(BaseModel):
@@ -61,19 +101,22 @@ class WebhookResponse(BaseModel):
 
 
 def generate_execution_id() -> str:
-    """Generate a ULID-style execution ID.
+    """Generate a ULID execution ID.
+
+    48-bit millisecond timestamp plus 80 random bits from os.urandom, in
+    the same lowercase Crockford base32 form as shared.ids (not bundled
+    into this function).
 
     Returns:
         Execution ID with 'ex_' prefix
     """
-    import time
-
-    # Use timestamp + random for uniqueness (simplified ULID)
-    timestamp = int(time.time() * 1000)
-    import random
+    value = (time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
 
-    random_part = random.randint(0, 0xFFFFFFFFFF)
-    return f"ex_{timestamp:012x}{random_part:010x}"
+    chars = [""] * 26
+    for i in range(25, -1, -1):
+        chars[i] = ULID_ALPHABET[value & 31]
+        value >>= 5
+    return "ex_" + "".join(chars)
 
 
 def parse_body(raw_body: str | None, content_type: str) -> dict[str, Any]:
@@ -94,7 +137,9 @@ def parse_body(raw_body: str | None, content_type: str) -> dict[str, Any]:
     # JSON body
     if "application/json" in content_type:
         try:
-            return json.loads(raw_body)
+            # Stdlib rather than orjson: orjson turns integers wider than
+            # 64 bits into floats, silently changing the client's payload
+            return _JSON_DECODER.decode(raw_body)
         except json.JSONDecodeError:
             logger.warning("Failed to parse JSON body, storing as raw")
             return {"raw": raw_body}
@@ -102,9 +147,18 @@ def parse_body(raw_body: str | None, content_type: str) -> dict[str, Any]:
     # Form-urlencoded body
     if "application/x-www-form-urlencoded" in content_type:
         try:
-            parsed = parse_qs(raw_body, keep_blank_values=True)
-            # Flatten single-value lists
-            return {k: v[0] if len(v) == 1 else v for k, v in parsed.items()}
+            form: dict[str, Any] = {}
+            for key, value in parse_qsl(
+                raw_body, keep_blank_values=True, max_num_fields=MAX_FORM_FIELDS
+            ):
+                # Single values stay scalar; repeated keys collect into a list
+                if key not in form:
+                    form[key] = value
+                elif isinstance(form[key], list):
+                    form[key].append(value)
+                else:
+                    form[key] = [form[key], value]
+            return form
         except Exception:
             logger.warning("Failed to parse form body, storing as raw")
             return {"raw": raw_body}
@@ -113,7 +167,7 @@ def parse_body(raw_body: str | None, content_type: str) -> dict[str, Any]:
     return {"raw": raw_body}
 
 
-def extract_headers(headers: dict[str, str] | None) -> dict[str, str]:
+def extract_headers(headers: Mapping[str, str] | None) -> dict[str, str]:
     """Extract relevant headers, excluding AWS-specific ones.
 
     Args:
@@ -125,28 +179,60 @@ def extract_headers(headers: dict[str, str] | None) -> dict[str, str]:
     if not headers:
         return {}
 
+    excluded = EXCLUDED_HEADERS
+    prefixes = EXCLUDED_HEADER_PREFIXES
     return {
         k: v
         for k, v in headers.items()
-        if k.lower() not in EXCLUDED_HEADERS
+        if (name := k.lower()) not in excluded and not name.startswith(prefixes)
     }
 
 
+def dump_message(message: dict) -> str:
+    """Serialize a queue message to JSON.
+
+    Uses orjson, falling back to the stdlib for values it rejects, such as
+    integers wider than 64 bits that parse_body keeps exact or strings
+    holding lone surrogates.
+
+    Args:
+        message: Message to serialize
+
+    Returns:
+        JSON string
+    """
+    try:
+        return orjson.dumps(message).decode()
+    except orjson.JSONEncodeError:
+        return _JSON_ENCODER.encode(message)
+
+
 @tracer.capture_method
 def get_workflow(workflow_id: str) -> dict | None:
     """Fetch workflow from DynamoDB.
 
+    Found workflows are cached per container for WORKFLOW_CACHE_TTL seconds.
+    Misses are not cached, so a newly created workflow is usable at once.
+
     Args:
         workflow_id: Workflow identifier
 
     Returns:
         Workflow dict or None if not found
     """
-    table = dynamodb.Table(WORKFLOWS_TABLE_NAME)
+    now = monotonic()
+    cached = _workflow_cache.get(workflow_id)
+    if cached and now - cached[0] < WORKFLOW_CACHE_TTL:
+        return cached[1]
 
-    response = table.get_item(Key={"workflow_id": workflow_id})
+    response = _workflows_table().get_item(Key={"workflow_id": workflow_id})
 
-    return response.get("Item")
+    workflow = response.get("Item")
+    if workflow is None:
+        _workflow_cache.pop(workflow_id, None)
+    else:
+        _workflow_cache[workflow_id] = (now, workflow)
+    return workflow
 
 
 @tracer.capture_method
@@ -169,19 +255,19 @@ def queue_execution(
         "trigger_data": trigger_data,
     }
 
-    sqs_client.send_message(
+    _sqs().send_message(
         QueueUrl=EXECUTION_QUEUE_URL,
-        MessageBody=json.dumps(message),
+        MessageBody=dump_message(message),
     )
 
 
-@app.post("/webhook/<workflow_id>")
 @tracer.capture_method
-def receive_webhook(workflow_id: str) -> dict:
+def receive_webhook(workflow_id: str, event: APIGatewayProxyEventV2) -> dict:
     """Receive webhook and queue workflow execution.
 
     Args:
         workflow_id: The workflow to trigger
+        event: The webhook request
 
     Returns:
         Response with execution_id and status
@@ -203,14 +289,18 @@ def receive_webhook(workflow_id: str) -> dict:
         logger.warning("Workflow disabled", workflow_id=workflow_id)
         raise BadRequestError(f"Workflow {workflow_id} is disabled")
 
+    # The headers property builds a new case-insensitive dict on every
+    # access, so read it once
+    request_headers = event.headers
+
     # Parse request body
-    content_type = app.current_event.headers.get("content-type", "")
-    raw_body = app.current_event.body
+    content_type = request_headers.get("content-type", "")
+    raw_body = event.body
     payload = parse_body(raw_body, content_type)
 
-    # Extract headers and query params
-    headers = extract_headers(dict(app.current_event.headers or {}))
-    query_params = dict(app.current_event.query_string_parameters or {})
+    # Extract headers and query params (Powertools v2 returns None when absent)
+    headers = extract_headers(request_headers)
+    query_params = event.query_string_parameters or {}
 
     # Build trigger data
     trigger_data = {
@@ -219,7 +309,7 @@ def receive_webhook(workflow_id: str) -> dict:
         "headers": headers,
         "query": query_params,
         "method": "POST",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": datetime.now(_UTC).isoformat(),
     }
 
     # Generate execution ID and queue
@@ -242,16 +332,74 @@ def receive_webhook(workflow_id: str) -> dict:
     }
 
 
+def json_response(status_code: int, body: dict) -> dict:
+    """Build an API Gateway HTTP API JSON response.
+
+    Args:
+        status_code: HTTP status code
+        body: Response body
+
+    Returns:
+        API Gateway HTTP API response
+    """
+    return {
+        "statusCode": status_code,
+        "body": orjson.dumps(body).decode(),
+        "isBase64Encoded": False,
+        "headers": {"Content-Type": "application/json"},
+    }
+
+
+# Unrouted requests always get the same response, so it is built once
+NOT_FOUND_RESPONSE = json_response(404, {"statusCode": 404, "message": "Not found"})
+
+
+def is_warmup_event(event: dict) -> bool:
+    """Check whether an invocation is a keep-warm ping rather than a webhook.
+
+    API Gateway events never carry these top-level keys, so a real request
+    cannot take this path.
+
+    Args:
+        event: Lambda event
+
+    Returns:
+        True for {"warmup": true} or an EventBridge scheduled event
+    """
+    return event.get("warmup") is True or event.get("detail-type") == "Scheduled Event"
+
+
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
 def handler(event: dict, context: LambdaContext) -> dict:
     """Lambda entry point.
 
+    API Gateway only routes POST /webhook/{workflow_id} here, so the request
+    is dispatched directly instead of through an event handler resolver.
+    Errors keep the resolver's {"statusCode", "message"} body shape.
+
+    Keep-warm pings ({"warmup": true} or an EventBridge scheduled event)
+    build the AWS clients and return without any DynamoDB or SQS calls.
+
     Args:
-        event: API Gateway HTTP API event
+        event: API Gateway HTTP API event, or a keep-warm ping
         context: Lambda context
 
     Returns:
         API Gateway HTTP API response
     """
-    return app.resolve(event, context)
+    if is_warmup_event(event):
+        _workflows_table()
+        _sqs()
+        return json_response(200, {"status": "warm"})
+
+    request = APIGatewayProxyEventV2(event)
+    workflow_id = (request.path_parameters or {}).get("workflow_id")
+
+    if not workflow_id or request.request_context.http.method != "POST":
+        return NOT_FOUND_RESPONSE
+
+    try:
+        return json_response(200, receive_webhook(workflow_id, request))
+    except ServiceError as e:
+        return json_response(e.status_code, {"statusCode": e.status_code, "message": e.msg})
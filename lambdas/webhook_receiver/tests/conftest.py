@@ -0,0 +1,80 @@
+"""Pytest fixtures for webhook receiver Lambda tests."""
+
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+# Set environment variables before importing handler
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("WORKFLOWS_TABLE_NAME", "test-Workflows")
+os.environ.setdefault(
+    "EXECUTION_QUEUE_URL", "https://sqs.us-east-1.amazonaws.com/123456789012/test-queue"
+)
+
+
+def pytest_configure(config):
+    """Register the markers used by this suite."""
+    config.addinivalue_line(
+        "markers", "unit: pure function tests with no handler invocation (run with -m unit)"
+    )
+
+
+class StubTable:
+    """In-memory stand-in for the Workflows table resource."""
+
+    def __init__(self):
+        self.items: dict[str, dict] = {}
+        self.get_item_calls = 0
+
+    def put(self, item: dict) -> None:
+        """Store a workflow item, keyed by workflow_id."""
+        self.items[item["workflow_id"]] = item
+
+    def get_item(self, *, Key: dict) -> dict:  # noqa: N803 - boto3 keyword
+        """Return the stored item in GetItem's response shape.
+
+        Keyword-only, like boto3, so a positional or misspelled argument in
+        the handler fails here instead of passing silently.
+        """
+        self.get_item_calls += 1
+        item = self.items.get(Key["workflow_id"])
+        return {} if item is None else {"Item": item}
+
+
+class StubSQS:
+    """In-memory stand-in for the SQS client that records sent messages."""
+
+    def __init__(self):
+        self.sent: list[dict] = []
+
+    def send_message(self, *, QueueUrl: str, MessageBody: str) -> dict:  # noqa: N803
+        """Record a SendMessage call.
+
+        Only the parameters the handler uses are accepted, so a renamed or
+        misspelled argument raises TypeError.
+        """
+        self.sent.append({"QueueUrl": QueueUrl, "MessageBody": MessageBody})
+        return {"MessageId": str(len(self.sent))}
+
+    @property
+    def messages(self) -> list[dict]:
+        """Decoded bodies of the sent messages, in send order."""
+        return [json.loads(call["MessageBody"]) for call in self.sent]
+
+
+@pytest.fixture(autouse=True)
+def aws(monkeypatch):
+    """Swap the handler's AWS resources for in-memory stubs.
+
+    Also empties the workflow cache so every test sees only the items it puts.
+    """
+    import handler
+
+    stubs = SimpleNamespace(table=StubTable(), sqs=StubSQS())
+    monkeypatch.setattr(handler, "_workflows_table", lambda: stubs.table)
+    monkeypatch.setattr(handler, "_sqs", lambda: stubs.sqs)
+    handler._workflow_cache.clear()
+    yield stubs
+    handler._workflow_cache.clear()
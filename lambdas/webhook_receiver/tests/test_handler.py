@@ -1,26 +1,40 @@
 """Tests for Webhook Receiver handler."""
 
 import json
-from unittest.mock import MagicMock, patch
+import math
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
+from handler import (
+    EXECUTION_QUEUE_URL,
+    MAX_FORM_FIELDS,
+    ULID_ALPHABET,
+    dump_message,
+    extract_headers,
+    generate_execution_id,
+    handler,
+    parse_body,
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_lambda_context():
-    """Create a mock Lambda context."""
-    context = MagicMock()
-    context.function_name = "webhook-receiver"
-    context.memory_limit_in_mb = 256
-    context.invoked_function_arn = "arn:aws:lambda:us-east-1:123456789:function:webhook-receiver"
-    context.aws_request_id = "test-request-id"
-    return context
+    """Create a lightweight Lambda context (read-only, shared by the module)."""
+    return SimpleNamespace(
+        function_name="webhook-receiver",
+        memory_limit_in_mb=256,
+        invoked_function_arn="arn:aws:lambda:us-east-1:123456789:function:webhook-receiver",
+        aws_request_id="test-request-id",
+        get_remaining_time_in_millis=lambda: 30000,
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_workflow():
     """Create a sample workflow from DynamoDB."""
-    return {
+    return MappingProxyType({
         "workflow_id": "wf_test123",
         "name": "Test Workflow",
         "enabled": True,
@@ -28,19 +42,43 @@ def sample_workflow():
         "steps": [
             {"step_id": "step_1", "type": "transform", "config": {}},
         ],
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def disabled_workflow():
     """Create a disabled workflow."""
-    return {
+    return MappingProxyType({
         "workflow_id": "wf_disabled",
         "name": "Disabled Workflow",
         "enabled": False,
         "trigger": {"type": "webhook"},
         "steps": [],
-    }
+    })
+
+
+# Static parts of the API Gateway event; create_api_event copies what it changes
+_REQUEST_CONTEXT = MappingProxyType({
+    "accountId": "123456789012",
+    "apiId": "testapi",
+    "domainName": "test.execute-api.us-east-1.amazonaws.com",
+    "domainPrefix": "test",
+    "requestId": "test-request-id",
+    "routeKey": "POST /webhook/{workflow_id}",
+    "stage": "$default",
+    "time": "12/Dec/2025:10:00:00 +0000",
+    "timeEpoch": 1734001200000,
+})
+_HTTP_CONTEXT = MappingProxyType({
+    "method": "POST",
+    "protocol": "HTTP/1.1",
+    "sourceIp": "127.0.0.1",
+    "userAgent": "TestClient/1.0",
+})
+_DEFAULT_HEADERS = MappingProxyType({
+    "user-agent": "TestClient/1.0",
+    "x-github-event": "push",
+})
 
 
 def create_api_event(
@@ -50,149 +88,103 @@ def create_api_event(
     query_params: dict | None = None,
     headers: dict | None = None,
 ) -> dict:
-    """Create a mock API Gateway HTTP API event."""
-    default_headers = {
-        "content-type": content_type,
-        "user-agent": "TestClient/1.0",
-        "x-github-event": "push",
-    }
-    if headers:
-        default_headers.update(headers)
+    """Create a mock API Gateway HTTP API event.
 
+    Every nested dict is a fresh copy, so tests may modify the event freely.
+    """
+    path = f"/webhook/{workflow_id}"
     return {
         "version": "2.0",
         "routeKey": "POST /webhook/{workflow_id}",
-        "rawPath": f"/webhook/{workflow_id}",
+        "rawPath": path,
         "rawQueryString": "",
-        "headers": default_headers,
+        "headers": {"content-type": content_type, **_DEFAULT_HEADERS, **(headers or {})},
         "queryStringParameters": query_params,
         "pathParameters": {"workflow_id": workflow_id},
         "body": body,
         "isBase64Encoded": False,
-        "requestContext": {
-            "accountId": "123456789012",
-            "apiId": "testapi",
-            "domainName": "test.execute-api.us-east-1.amazonaws.com",
-            "domainPrefix": "test",
-            "http": {
-                "method": "POST",
-                "path": f"/webhook/{workflow_id}",
-                "protocol": "HTTP/1.1",
-                "sourceIp": "127.0.0.1",
-                "userAgent": "TestClient/1.0",
-            },
-            "requestId": "test-request-id",
-            "routeKey": "POST /webhook/{workflow_id}",
-            "stage": "$default",
-            "time": "12/Dec/2025:10:00:00 +0000",
-            "timeEpoch": 1734001200000,
-        },
+        "requestContext": {**_REQUEST_CONTEXT, "http": {**_HTTP_CONTEXT, "path": path}},
     }
 
 
+def response_body(result: dict) -> dict:
+    """Check a handler response is JSON and return its decoded body."""
+    assert result["headers"]["Content-Type"] == "application/json"
+    return json.loads(result["body"])
+
+
 class TestWebhookReceiver:
     """Test webhook receiver handler."""
 
-    @patch("handler.sqs_client")
-    @patch("handler.dynamodb")
-    def test_json_body_parsing(
-        self, mock_dynamodb, mock_sqs, sample_workflow, mock_lambda_context
+    @pytest.mark.parametrize(
+        ("body", "content_type", "expected_payload"),
+        [
+            pytest.param(
+                json.dumps({"name": "test", "count": 42}),
+                "application/json",
+                {"name": "test", "count": 42},
+                id="json",
+            ),
+            pytest.param(
+                "name=test&value=123",
+                "application/x-www-form-urlencoded",
+                {"name": "test", "value": "123"},
+                id="form",
+            ),
+            pytest.param("some raw text", "text/plain", {"raw": "some raw text"}, id="raw"),
+            pytest.param(None, "application/json", {}, id="empty"),
+        ],
+    )
+    def test_body_parsed_into_payload(
+        self,
+        body,
+        content_type,
+        expected_payload,
+        aws,
+        sample_workflow,
+        mock_lambda_context,
     ):
-        """Test that JSON body is correctly parsed."""
-        from handler import handler
-
-        # Setup mocks
-        mock_table = MagicMock()
-        mock_table.get_item.return_value = {"Item": sample_workflow}
-        mock_dynamodb.Table.return_value = mock_table
+        """Test that each body type is parsed into the queued trigger payload."""
+        aws.table.put(sample_workflow)
 
         event = create_api_event(
             workflow_id="wf_test123",
-            body=json.dumps({"name": "test", "count": 42}),
-            content_type="application/json",
+            body=body,
+            content_type=content_type,
         )
 
         result = handler(event, mock_lambda_context)
-        body = json.loads(result["body"])
+        response = response_body(result)
 
         assert result["statusCode"] == 200
-        assert body["status"] == "queued"
-        assert body["workflow_id"] == "wf_test123"
-        assert "execution_id" in body
+        assert response["status"] == "queued"
+        assert response["workflow_id"] == "wf_test123"
+        assert "execution_id" in response
 
         # Verify SQS message was sent
-        mock_sqs.send_message.assert_called_once()
-        call_args = mock_sqs.send_message.call_args
-        message_body = json.loads(call_args.kwargs["MessageBody"])
+        assert len(aws.sqs.messages) == 1
+        message_body = aws.sqs.messages[0]
         assert message_body["trigger_type"] == "webhook"
-        assert message_body["trigger_data"]["payload"]["name"] == "test"
-        assert message_body["trigger_data"]["payload"]["count"] == 42
-
-    @patch("handler.sqs_client")
-    @patch("handler.dynamodb")
-    def test_form_body_parsing(
-        self, mock_dynamodb, mock_sqs, sample_workflow, mock_lambda_context
-    ):
-        """Test that form-urlencoded body is correctly parsed."""
-        from handler import handler
-
-        mock_table = MagicMock()
-        mock_table.get_item.return_value = {"Item": sample_workflow}
-        mock_dynamodb.Table.return_value = mock_table
-
-        event = create_api_event(
-            workflow_id="wf_test123",
-            body="name=test&value=123",
-            content_type="application/x-www-form-urlencoded",
-        )
-
-        result = handler(event, mock_lambda_context)
-        body = json.loads(result["body"])
+        assert message_body["trigger_data"]["payload"] == expected_payload
 
-        assert result["statusCode"] == 200
-        assert body["status"] == "queued"
-
-        # Verify form data was parsed
-        call_args = mock_sqs.send_message.call_args
-        message_body = json.loads(call_args.kwargs["MessageBody"])
-        assert message_body["trigger_data"]["payload"]["name"] == "test"
-        assert message_body["trigger_data"]["payload"]["value"] == "123"
-
-    @patch("handler.sqs_client")
-    @patch("handler.dynamodb")
-    def test_raw_body_fallback(
-        self, mock_dynamodb, mock_sqs, sample_workflow, mock_lambda_context
+    def test_workflow_cached_second_call(
+        self, aws, sample_workflow, mock_lambda_context
     ):
-        """Test that unknown content types store raw body."""
-        from handler import handler
+        """Test that a warm container reuses the workflow until the TTL expires."""
+        aws.table.put(sample_workflow)
 
-        mock_table = MagicMock()
-        mock_table.get_item.return_value = {"Item": sample_workflow}
-        mock_dynamodb.Table.return_value = mock_table
+        event = create_api_event(workflow_id="wf_test123", body="{}")
 
-        event = create_api_event(
-            workflow_id="wf_test123",
-            body="some raw text",
-            content_type="text/plain",
-        )
+        assert handler(event, mock_lambda_context)["statusCode"] == 200
+        assert handler(event, mock_lambda_context)["statusCode"] == 200
+        assert aws.table.get_item_calls == 1
 
-        result = handler(event, mock_lambda_context)
+        with patch("handler.monotonic", return_value=float("inf")):
+            handler(event, mock_lambda_context)
+        assert aws.table.get_item_calls == 2
 
-        assert result["statusCode"] == 200
-
-        call_args = mock_sqs.send_message.call_args
-        message_body = json.loads(call_args.kwargs["MessageBody"])
-        assert message_body["trigger_data"]["payload"]["raw"] == "some raw text"
-
-    @patch("handler.dynamodb")
-    def test_workflow_not_found(self, mock_dynamodb, mock_lambda_context):
+    def test_workflow_not_found(self, aws, mock_lambda_context):
         """Test 404 response for missing workflow."""
-        from handler import handler
-
-        mock_table = MagicMock()
-        mock_table.get_item.return_value = {}  # No Item
-        mock_dynamodb.Table.return_value = mock_table
-
         event = create_api_event(
             workflow_id="wf_nonexistent",
             body="{}",
@@ -201,19 +193,46 @@ class TestWebhookReceiver:
         result = handler(event, mock_lambda_context)
 
         assert result["statusCode"] == 404
-        body = json.loads(result["body"])
+        body = response_body(result)
         assert "not found" in body["message"].lower()
+        assert aws.sqs.sent == []
+
+    def test_unrouted_request_returns_404(self, mock_lambda_context):
+        """Test that a request without a workflow_id or not a POST gets a 404."""
+        event = create_api_event(workflow_id="wf_test123", body="{}")
+        event["requestContext"]["http"]["method"] = "GET"
+        missing_id = create_api_event(workflow_id="wf_test123", body="{}")
+        missing_id["pathParameters"] = None
+
+        for request in (event, missing_id):
+            result = handler(request, mock_lambda_context)
+            assert result["statusCode"] == 404
+            assert response_body(result) == {"statusCode": 404, "message": "Not found"}
+
+    @pytest.mark.parametrize(
+        "event",
+        [
+            pytest.param({"warmup": True}, id="warmup-flag"),
+            pytest.param(
+                {"source": "aws.events", "detail-type": "Scheduled Event", "detail": {}},
+                id="scheduled-event",
+            ),
+        ],
+    )
+    def test_warmup_event_skips_aws_calls(self, event, aws, mock_lambda_context):
+        """Test that keep-warm pings return 200 without reading or queueing."""
+        result = handler(event, mock_lambda_context)
+
+        assert result["statusCode"] == 200
+        assert response_body(result) == {"status": "warm"}
+        assert aws.table.get_item_calls == 0
+        assert aws.sqs.sent == []
 
-    @patch("handler.dynamodb")
     def test_workflow_disabled(
-        self, mock_dynamodb, disabled_workflow, mock_lambda_context
+        self, aws, disabled_workflow, mock_lambda_context
     ):
         """Test 400 response for disabled workflow."""
-        from handler import handler
-
-        mock_table = MagicMock()
-        mock_table.get_item.return_value = {"Item": disabled_workflow}
-        mock_dynamodb.Table.return_value = mock_table
+        aws.table.put(disabled_workflow)
 
         event = create_api_event(
             workflow_id="wf_disabled",
@@ -223,20 +242,15 @@ class TestWebhookReceiver:
         result = handler(event, mock_lambda_context)
 
         assert result["statusCode"] == 400
-        body = json.loads(result["body"])
+        body = response_body(result)
         assert "disabled" in body["message"].lower()
+        assert aws.sqs.sent == []
 
-    @patch("handler.sqs_client")
-    @patch("handler.dynamodb")
     def test_headers_extracted(
-        self, mock_dynamodb, mock_sqs, sample_workflow, mock_lambda_context
+        self, aws, sample_workflow, mock_lambda_context
     ):
         """Test that relevant headers are included in trigger data."""
-        from handler import handler
-
-        mock_table = MagicMock()
-        mock_table.get_item.return_value = {"Item": sample_workflow}
-        mock_dynamodb.Table.return_value = mock_table
+        aws.table.put(sample_workflow)
 
         event = create_api_event(
             workflow_id="wf_test123",
@@ -250,8 +264,7 @@ class TestWebhookReceiver:
         result = handler(event, mock_lambda_context)
         assert result["statusCode"] == 200
 
-        call_args = mock_sqs.send_message.call_args
-        message_body = json.loads(call_args.kwargs["MessageBody"])
+        message_body = aws.sqs.messages[0]
         headers = message_body["trigger_data"]["headers"]
 
         # Should include custom headers
@@ -261,17 +274,11 @@ class TestWebhookReceiver:
         assert "x-amzn-trace-id" not in headers
         assert "host" not in headers
 
-    @patch("handler.sqs_client")
-    @patch("handler.dynamodb")
     def test_query_params_extracted(
-        self, mock_dynamodb, mock_sqs, sample_workflow, mock_lambda_context
+        self, aws, sample_workflow, mock_lambda_context
     ):
         """Test that query parameters are included in trigger data."""
-        from handler import handler
-
-        mock_table = MagicMock()
-        mock_table.get_item.return_value = {"Item": sample_workflow}
-        mock_dynamodb.Table.return_value = mock_table
+        aws.table.put(sample_workflow)
 
         event = create_api_event(
             workflow_id="wf_test123",
@@ -282,24 +289,29 @@ class TestWebhookReceiver:
         result = handler(event, mock_lambda_context)
         assert result["statusCode"] == 200
 
-        call_args = mock_sqs.send_message.call_args
-        message_body = json.loads(call_args.kwargs["MessageBody"])
+        message_body = aws.sqs.messages[0]
         query = message_body["trigger_data"]["query"]
 
         assert query["token"] == "abc123"
         assert query["debug"] == "true"
 
-    @patch("handler.sqs_client")
-    @patch("handler.dynamodb")
+    def test_missing_query_params_stored_empty(
+        self, aws, sample_workflow, mock_lambda_context
+    ):
+        """Test that a request without a query string stores an empty dict."""
+        aws.table.put(sample_workflow)
+
+        event = create_api_event(workflow_id="wf_test123", body="{}")
+
+        result = handler(event, mock_lambda_context)
+        assert result["statusCode"] == 200
+        assert aws.sqs.messages[0]["trigger_data"]["query"] == {}
+
     def test_sqs_message_format(
-        self, mock_dynamodb, mock_sqs, sample_workflow, mock_lambda_context
+        self, aws, sample_workflow, mock_lambda_context
     ):
         """Test that SQS message has correct structure."""
-        from handler import handler
-
-        mock_table = MagicMock()
-        mock_table.get_item.return_value = {"Item": sample_workflow}
-        mock_dynamodb.Table.return_value = mock_table
+        aws.table.put(sample_workflow)
 
         event = create_api_event(
             workflow_id="wf_test123",
@@ -309,8 +321,9 @@ class TestWebhookReceiver:
         result = handler(event, mock_lambda_context)
         assert result["statusCode"] == 200
 
-        call_args = mock_sqs.send_message.call_args
-        message_body = json.loads(call_args.kwargs["MessageBody"])
+        message_body = aws.sqs.messages[0]
+
+        assert aws.sqs.sent[0]["QueueUrl"] == EXECUTION_QUEUE_URL
 
         # Verify message structure
         assert "workflow_id" in message_body
@@ -331,17 +344,11 @@ class TestWebhookReceiver:
         assert "method" in trigger_data
         assert "timestamp" in trigger_data
 
-    @patch("handler.sqs_client")
-    @patch("handler.dynamodb")
     def test_execution_id_returned(
-        self, mock_dynamodb, mock_sqs, sample_workflow, mock_lambda_context
+        self, aws, sample_workflow, mock_lambda_context
     ):
         """Test that response includes execution_id."""
-        from handler import handler
-
-        mock_table = MagicMock()
-        mock_table.get_item.return_value = {"Item": sample_workflow}
-        mock_dynamodb.Table.return_value = mock_table
+        aws.table.put(sample_workflow)
 
         event = create_api_event(
             workflow_id="wf_test123",
@@ -349,97 +356,94 @@ class TestWebhookReceiver:
         )
 
         result = handler(event, mock_lambda_context)
-        body = json.loads(result["body"])
+        body = response_body(result)
 
         assert "execution_id" in body
         assert body["execution_id"].startswith("ex_")
         # Execution ID should be unique - check it has reasonable length
         assert len(body["execution_id"]) > 20
 
-    @patch("handler.sqs_client")
-    @patch("handler.dynamodb")
-    def test_empty_body_handled(
-        self, mock_dynamodb, mock_sqs, sample_workflow, mock_lambda_context
-    ):
-        """Test that empty body is handled gracefully."""
-        from handler import handler
 
-        mock_table = MagicMock()
-        mock_table.get_item.return_value = {"Item": sample_workflow}
-        mock_dynamodb.Table.return_value = mock_table
+@pytest.mark.unit
+class TestExecutionId:
+    """Test execution ID generation."""
 
-        event = create_api_event(
-            workflow_id="wf_test123",
-            body=None,
-        )
+    def test_ulid_format(self):
+        """Test that IDs are 'ex_' plus a 26-char lowercase Crockford ULID."""
+        execution_id = generate_execution_id()
 
-        result = handler(event, mock_lambda_context)
-        body = json.loads(result["body"])
+        assert execution_id.startswith("ex_")
+        assert len(execution_id) == 29
+        assert all(c in ULID_ALPHABET for c in execution_id[3:])
 
-        assert result["statusCode"] == 200
-        assert body["status"] == "queued"
+    def test_ids_are_unique_and_time_ordered(self):
+        """Test that IDs differ and later timestamps sort later."""
+        with patch("handler.time_ns", return_value=1_700_000_000_000_000_000):
+            earlier = generate_execution_id()
+        with patch("handler.time_ns", return_value=1_700_000_000_001_000_000):
+            later = generate_execution_id()
 
-        call_args = mock_sqs.send_message.call_args
-        message_body = json.loads(call_args.kwargs["MessageBody"])
-        assert message_body["trigger_data"]["payload"] == {}
+        assert generate_execution_id() != generate_execution_id()
+        assert earlier < later
 
 
+@pytest.mark.unit
 class TestBodyParsing:
     """Test body parsing functions."""
 
-    def test_parse_valid_json(self):
-        """Test parsing valid JSON body."""
-        from handler import parse_body
-
-        result = parse_body('{"key": "value"}', "application/json")
-        assert result == {"key": "value"}
-
-    def test_parse_invalid_json(self):
-        """Test parsing invalid JSON returns raw."""
-        from handler import parse_body
-
-        result = parse_body("not json", "application/json")
-        assert result == {"raw": "not json"}
-
-    def test_parse_form_urlencoded(self):
-        """Test parsing form-urlencoded body."""
-        from handler import parse_body
-
-        result = parse_body("a=1&b=2", "application/x-www-form-urlencoded")
-        assert result == {"a": "1", "b": "2"}
-
-    def test_parse_form_urlencoded_multi_value(self):
-        """Test parsing form-urlencoded with multi-value params."""
-        from handler import parse_body
+    @pytest.mark.parametrize(
+        ("raw_body", "content_type", "expected"),
+        [
+            pytest.param('{"key": "value"}', "application/json", {"key": "value"}, id="json"),
+            pytest.param("not json", "application/json", {"raw": "not json"}, id="invalid-json"),
+            pytest.param(
+                "a=1&b=2", "application/x-www-form-urlencoded", {"a": "1", "b": "2"}, id="form"
+            ),
+            pytest.param(
+                "a=1&a=2&a=3",
+                "application/x-www-form-urlencoded",
+                {"a": ["1", "2", "3"]},
+                id="form-multi-value",
+            ),
+            pytest.param(
+                "a=&b=1&c=x&b=2",
+                "application/x-www-form-urlencoded",
+                {"a": "", "b": ["1", "2"], "c": "x"},
+                id="form-mixed-and-blank",
+            ),
+            pytest.param("raw text", "text/plain", {"raw": "raw text"}, id="unknown-type"),
+            pytest.param(None, "application/json", {}, id="none"),
+            pytest.param("", "application/json", {}, id="empty"),
+        ],
+    )
+    def test_parse_body(self, raw_body, content_type, expected):
+        """Test body parsing for each content type and edge case."""
+        assert parse_body(raw_body, content_type) == expected
 
-        result = parse_body("a=1&a=2&a=3", "application/x-www-form-urlencoded")
-        assert result == {"a": ["1", "2", "3"]}
+    def test_parse_form_too_many_fields_stored_raw(self):
+        """Test that a form body over MAX_FORM_FIELDS is kept raw, not parsed."""
+        raw_body = "&".join(f"f{i}=1" for i in range(MAX_FORM_FIELDS + 1))
 
-    def test_parse_unknown_content_type(self):
-        """Test unknown content type returns raw."""
-        from handler import parse_body
+        result = parse_body(raw_body, "application/x-www-form-urlencoded")
+        assert result == {"raw": raw_body}
 
-        result = parse_body("raw text", "text/plain")
-        assert result == {"raw": "raw text"}
+    def test_parse_json_non_standard_numbers(self):
+        """Test that NaN is accepted, as the stdlib decoder allows."""
+        result = parse_body('{"value": NaN}', "application/json")
+        assert math.isnan(result["value"])
 
-    def test_parse_empty_body(self):
-        """Test parsing empty body."""
-        from handler import parse_body
-
-        result = parse_body(None, "application/json")
-        assert result == {}
-
-        result = parse_body("", "application/json")
-        assert result == {}
+    def test_parse_json_keeps_big_ints_exact(self):
+        """Test that integers wider than 64 bits are not rounded to floats."""
+        result = parse_body('{"id": 123456789012345678901234567890}', "application/json")
+        assert result == {"id": 123456789012345678901234567890}
 
 
+@pytest.mark.unit
 class TestHeaderExtraction:
     """Test header extraction function."""
 
     def test_extract_headers_filters_aws(self):
         """Test that AWS headers are filtered out."""
-        from handler import extract_headers
-
         headers = {
             "content-type": "application/json",
             "x-amzn-trace-id": "Root=1-abc123",
@@ -456,16 +460,72 @@ class TestHeaderExtraction:
         assert "x-forwarded-for" not in result
         assert "host" not in result
 
+    @pytest.mark.parametrize(
+        ("name", "kept"),
+        [
+            ("X-Amzn-Trace-Id", False),
+            ("x-amzn-requestid", False),
+            ("X-Forwarded-Host", False),
+            ("cloudfront-viewer-country", False),
+            ("Host", False),
+            ("x-amz-sns-message-type", True),
+            ("x-hub-signature-256", True),
+            ("forwarded", True),
+        ],
+    )
+    def test_extract_headers_prefix_filter(self, name, kept):
+        """Test exact and prefix exclusion, case-insensitively, keeping the original name."""
+        assert (name in extract_headers({name: "v"})) is kept
+
+    def test_extract_headers_leaves_input_untouched(self):
+        """Test that filtering builds a new dict instead of deleting from the input."""
+        headers = {"host": "api.example.com", "x-custom-header": "v"}
+
+        result = extract_headers(headers)
+
+        assert result == {"x-custom-header": "v"}
+        assert headers == {"host": "api.example.com", "x-custom-header": "v"}
+
     def test_extract_headers_none(self):
         """Test extracting from None headers."""
-        from handler import extract_headers
-
         result = extract_headers(None)
         assert result == {}
 
     def test_extract_headers_empty(self):
         """Test extracting from empty headers."""
-        from handler import extract_headers
-
         result = extract_headers({})
         assert result == {}
+
+    def test_extract_headers_accepts_any_mapping(self):
+        """Test extracting from a read-only mapping without copying it first."""
+        headers = MappingProxyType({"host": "api.example.com", "x-custom-header": "v"})
+
+        result = extract_headers(headers)
+        assert result == {"x-custom-header": "v"}
+
+
+@pytest.mark.unit
+class TestDumpMessage:
+    """Test queue message serialization."""
+
+    def test_dump_message_round_trips(self):
+        """Test that messages serialize to equivalent JSON."""
+        message = {"workflow_id": "wf_1", "trigger_data": {"payload": {"a": [1, 2.5, None]}}}
+        assert json.loads(dump_message(message)) == message
+
+    def test_dump_message_falls_back_for_big_ints(self):
+        """Test that a parsed big-int payload, which orjson rejects, serializes exactly."""
+        payload = parse_body('{"id": 123456789012345678901234567890}', "application/json")
+        message = {"payload": payload}
+        assert json.loads(dump_message(message)) == message
+
+    def test_dump_message_escapes_lone_surrogates(self):
+        """Test that a lone surrogate, which orjson rejects, yields encodable JSON."""
+        payload = parse_body('{"a":"\\ud800"}', "application/json")
+        message = {"payload": payload}
+
+        dumped = dump_message(message)
+
+        assert dumped.isascii()
+        dumped.encode("utf-8")  # What SQS SendMessage needs to succeed
+        assert json.loads(dumped) == message